@@ -119,10 +119,18 @@ def _get_retention_manager() -> RetentionManager:
     return cast("RetentionManager", _components["retention_manager"])
 
 
+def _close_components() -> None:
+    """Shut down the worker pools of components created during this command."""
+    engine = _components.get("backup_engine")
+    if engine is not None:
+        engine.close()
+
+
 @click.group()
-def cli() -> None:
+@click.pass_context
+def cli(ctx: click.Context) -> None:
     """Quartermaster - CLI Interface"""
-    pass
+    ctx.call_on_close(_close_components)
 
 
 # Register subcommands from commands/ package
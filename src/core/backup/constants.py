@@ -17,10 +17,19 @@ DEFAULT_PROJECT_RETENTION_DAYS = 30
 DEFAULT_DATABASE_RETENTION_DAYS = 14
 
 # Compression and logging constants
+BYTES_PER_MB = 1024 * 1024
 ESTIMATED_COMPRESSION_RATIO = 0.7  # tar.gz typically achieves 60-80% compression for code
+TAR_IO_BUFFER_SIZE = 1 << 20  # 1 MiB tar record and file write buffer (tarfile default is 10 KiB)
+TAR_GZIP_COMPRESSLEVEL = 6  # zlib default; level 9 costs much more CPU for marginal size gains
+CHECKSUM_CHUNK_SIZE = 8 << 20  # 8 MiB slices/reads fed to the hasher; small reads cap hashing throughput
 LOG_MAX_BYTES = 10 * 1024 * 1024  # 10 MB max per log file
 LOG_BACKUP_COUNT = 5  # Number of rotated log files to keep
 MIN_DB_BACKUP_SPACE_MB = 1024  # 1 GB minimum free space for database backups
+SKIP_ESTIMATOR_FREE_BYTES = 5 * 1024**3  # Skip the pre-backup size walk when this much space is free
+
+# Concurrent project backups per backup disk (override with system.disk_parallelism)
+HDD_DISK_PARALLELISM = 2  # Seeks dominate beyond two sequential writers on spinning disks
+SSD_DISK_PARALLELISM = 8
 
 # Dotfiles/underscore-files to include despite the auto-exclude rule.
 # These are critical config files that live in project roots.
@@ -6,10 +6,10 @@ import os
 import shutil
 import subprocess
 import tempfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from ..config_manager import ConfigManager
 from .constants import (
@@ -110,7 +110,7 @@ password="{password}"
         self.logger.debug("Disk space check passed: %s", space_msg)
 
         mysql_config_file = None
-        local_backup_path = None
+        local_backup_path: Path | None = None
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_name = f"{db_name}_{timestamp}.sql"
@@ -221,7 +221,7 @@ password="{password}"
         """Backup all enabled databases (optionally in parallel)
 
         Args:
-            parallel: If True, run backups in parallel using ThreadPoolExecutor
+            parallel: If True, run backups in parallel on the engine's worker pool
             skip_if_exists_today: Skip databases that already have a backup today
         """
         results = {}
@@ -233,24 +233,24 @@ password="{password}"
                 results[db_name] = self.backup_database(db_name, skip_if_exists_today=skip_if_exists_today)
         else:
             # Parallel execution
-            max_workers = self.config.get_setting("system.max_parallel_backups", 4)
-            self.logger.info("Starting parallel backup of %s databases with %s workers", len(db_names), max_workers)
-
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all backup tasks
-                future_to_db = {
-                    executor.submit(self.backup_database, db_name, None, skip_if_exists_today): db_name
-                    for db_name in db_names
-                }
-
-                # Collect results as they complete
-                for future in as_completed(future_to_db):
-                    db_name = future_to_db[future]
-                    try:
-                        results[db_name] = future.result()
-                    except Exception as e:
-                        self.logger.error("Parallel backup failed for database '%s': %s", db_name, e, exc_info=True)
-                        results[db_name] = (False, f"Backup failed: {e!s}")
+            workers = min(self._pool_size("thread"), len(db_names))
+            self.logger.info("Starting parallel backup of %s databases with %s workers", len(db_names), workers)
+
+            executor = self._get_executor()
+            # Submit all backup tasks
+            future_to_db = {
+                executor.submit(self.backup_database, db_name, None, skip_if_exists_today): db_name
+                for db_name in db_names
+            }
+
+            # Collect results as they complete
+            for future in as_completed(future_to_db):
+                db_name = future_to_db[future]
+                try:
+                    results[db_name] = future.result()
+                except Exception as e:
+                    self.logger.error("Parallel backup failed for database '%s': %s", db_name, e, exc_info=True)
+                    results[db_name] = (False, f"Backup failed: {e!s}")
 
         return results
 
@@ -273,23 +273,13 @@ password="{password}"
             return False, str(e)
 
         # Verify backup integrity before restoring
-        verify_ok, verify_msg = self.verify_backup("database", db_name, backup_file)
+        verify_ok, verify_msg = self.verify_backup("database", db_name, backup_file, quick=False)
         if not verify_ok:
             self.logger.warning("Backup verification failed: %s", verify_msg)
             return False, f"Restore aborted - backup verification failed: {verify_msg}"
 
         mysql_config_file = None
-        sql_file = None
         try:
-            # Decompress if needed
-            if backup_file.endswith(".gz"):
-                with tempfile.NamedTemporaryFile(suffix=".sql", delete=False) as tmp:
-                    with gzip.open(backup_path, "rb") as f_in:
-                        shutil.copyfileobj(f_in, tmp)
-                    sql_file = tmp.name
-            else:
-                sql_file = str(backup_path)
-
             # Create secure MySQL configuration file
             mysql_config_file = self._create_mysql_config_file(db_config)
 
@@ -297,13 +287,10 @@ password="{password}"
             cmd = ["mysql", f"--defaults-extra-file={mysql_config_file}", db_name]
 
             # Execute restore
-            with open(sql_file) as f:
-                result = subprocess.run(
-                    cmd, stdin=f, stderr=subprocess.PIPE, text=True, timeout=self._get_timeout("mysql_restore")
-                )
+            returncode, stderr = self._pipe_into_mysql(cmd, backup_path)
 
-            if result.returncode != 0:
-                self.logger.debug("mysql restore stderr: %s", result.stderr)
+            if returncode != 0:
+                self.logger.debug("mysql restore stderr: %s", stderr)
                 raise RuntimeError("mysql restore failed (check logs for details)")
 
             self.logger.info("Successfully restored database '%s' from %s", db_name, backup_file)
@@ -315,15 +302,54 @@ password="{password}"
 
         finally:
             # Clean up temporary files
-            if sql_file and backup_file.endswith(".gz") and os.path.exists(sql_file):
-                try:
-                    os.remove(sql_file)
-                except Exception as e:
-                    self.logger.warning("Failed to remove temporary SQL file: %s", e)
-
             if mysql_config_file and os.path.exists(mysql_config_file):
                 try:
                     os.remove(mysql_config_file)
                     self.logger.debug("Removed temporary MySQL config file")
                 except Exception as e:
                     self.logger.warning("Failed to remove temporary config file: %s", e)
+
+    def _pipe_into_mysql(self, cmd: list[str], backup_path: Path) -> tuple[int, str]:
+        """Feed a SQL dump into a mysql client command.
+
+        Compressed dumps are streamed through ``gzip -dc`` so no temporary SQL
+        file is written and decompression overlaps the restore.
+
+        Args:
+            cmd: mysql command line
+            backup_path: Path to the .sql or .sql.gz dump
+
+        Returns:
+            Tuple of (mysql return code, mysql stderr)
+        """
+        timeout = self._get_timeout("mysql_restore")
+        decompressor: subprocess.Popen[bytes] | None = None
+        if backup_path.name.endswith(".gz"):
+            decompressor = subprocess.Popen(
+                ["gzip", "-dc", str(backup_path)], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+            assert decompressor.stdout is not None
+            sql_source: IO[bytes] = decompressor.stdout
+        else:
+            sql_source = open(backup_path, "rb")  # noqa: SIM115 - closed in finally
+
+        try:
+            with subprocess.Popen(cmd, stdin=sql_source, stderr=subprocess.PIPE) as proc:
+                # mysql holds its own handle; closing ours lets gzip see EPIPE if mysql exits early
+                sql_source.close()
+                try:
+                    _, stderr = proc.communicate(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    raise
+
+            if decompressor is not None and decompressor.wait(timeout=timeout) != 0 and proc.returncode == 0:
+                raise RuntimeError("gzip decompression failed (backup may be truncated)")
+
+            return proc.returncode, stderr.decode("utf-8", errors="replace")
+
+        finally:
+            sql_source.close()
+            if decompressor is not None and decompressor.poll() is None:
+                decompressor.kill()
+                decompressor.wait(timeout=10)
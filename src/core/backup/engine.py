@@ -1,13 +1,15 @@
 """Core Backup Engine for Quartermaster — main class composing all mixins."""
 
 import fcntl
-import fnmatch
 import logging
+import multiprocessing
 import os
 import re
 import sys
 import tarfile
+import threading
 from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -23,16 +25,19 @@ from .constants import (
     GIT_BUNDLE_TIMEOUT,
     GIT_CLONE_TIMEOUT,
     GIT_VERIFY_TIMEOUT,
+    HDD_DISK_PARALLELISM,
     LOG_BACKUP_COUNT,
     LOG_MAX_BYTES,
     MYSQLDUMP_TIMEOUT,
     MYSQL_RESTORE_TIMEOUT,
+    SKIP_ESTIMATOR_FREE_BYTES,
+    SSD_DISK_PARALLELISM,
     WHITELISTED_DOTFILES,
 )
 from .database_ops import DatabaseBackupMixin
 from .git_ops import GitBackupMixin
-from .metadata import MetadataMixin
-from .project_ops import ProjectBackupMixin
+from .metadata import MetadataMixin, metadata_filename
+from .project_ops import ProjectBackupMixin, _compile_globs, _init_backup_worker
 from .retention import RetentionMixin
 from .sync import SyncMixin
 
@@ -66,6 +71,13 @@ class BackupEngine(
         self.sync_path: Path | None = storage_paths.get("sync")
         self.git_manager = GitManager()
 
+        # Parsed metadata sidecars keyed by path, validated by (mtime_ns, size)
+        self._meta_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+        # Persistent worker pools for parallel backups, created on first use
+        self._executors: dict[str, Executor] = {}
+        self._executor_lock = threading.Lock()
+
         # Set up notifications
         self.notifier = None
         if enable_notifications and NOTIFICATIONS_AVAILABLE and NotificationManagerClass is not None:
@@ -83,6 +95,93 @@ class BackupEngine(
         # Set up logging
         self.logger = self._setup_logger()
 
+    def _get_executor(self, kind: str = "thread") -> Executor:
+        """Return the persistent worker pool of the given kind, creating it on first use.
+
+        Args:
+            kind: "thread" for the shared I/O thread pool, "project" for the
+                project backup thread pool, "process" for the project backup
+                process pool, "checksum" for checksum backfills, "snapshot"
+                for quick_snapshot's project and database backups
+
+        Returns:
+            Executor sized by _pool_size
+        """
+        with self._executor_lock:
+            executor = self._executors.get(kind)
+            if executor is None:
+                max_workers = self._pool_size(kind)
+                if kind == "process":
+                    executor = ProcessPoolExecutor(
+                        max_workers=max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_backup_worker,
+                        initargs=(str(self.config.config_dir), self.notifier is not None),
+                    )
+                else:
+                    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="qm-backup")
+                self._executors[kind] = executor
+            return executor
+
+    def _pool_size(self, kind: str) -> int:
+        """Worker count for a pool kind, capped below system.max_parallel_backups.
+
+        Database dumps, git bundles and metadata reads mostly wait on
+        subprocesses and the network, so the shared pool allows twice the CPU
+        count. Project backups compress on the CPU and stream to local disk, so
+        they are also capped at the CPU count and the disk's parallelism.
+        Checksum backfills hash with the GIL released and are sized by
+        system.backfill_threads under the same disk cap. Snapshots get their own
+        pool, sized like the shared one, so a snapshot started from a shared-pool
+        worker never waits on that pool.
+        Threads and processes are started on demand, so a short queue never
+        spins up the whole pool.
+
+        Args:
+            kind: Pool kind as passed to _get_executor
+
+        Returns:
+            Maximum number of workers (at least 1)
+        """
+        cpus = os.cpu_count() or 4
+        if kind == "checksum":
+            threads = int(self.config.get_setting("system.backfill_threads", 8))
+            return max(1, min(threads, 2 * cpus, self._disk_parallelism()))
+        configured = int(self.config.get_setting("system.max_parallel_backups", 4))
+        if kind in ("thread", "snapshot"):
+            return max(1, min(configured, 2 * cpus))
+        return max(1, min(configured, cpus, self._disk_parallelism()))
+
+    def _disk_parallelism(self) -> int:
+        """Concurrent writers the backup disk handles well (system.disk_parallelism overrides).
+
+        Detects spinning disks through /sys/dev/block/<dev>/queue/rotational on
+        Linux; anything undetectable is treated as solid state.
+        """
+        override = self.config.get_setting("system.disk_parallelism", None)
+        if override:
+            return int(override)
+        try:
+            dev = os.stat(self.local_path).st_dev
+            block = Path(f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}").resolve()
+            # Partitions keep their queue settings on the parent device
+            rotational = block / "queue" / "rotational"
+            if not rotational.exists():
+                rotational = block.parent / "queue" / "rotational"
+            if rotational.read_text().strip() == "1":
+                return HDD_DISK_PARALLELISM
+        except OSError:
+            pass
+        return SSD_DISK_PARALLELISM
+
+    def close(self) -> None:
+        """Shut down the persistent worker pools, waiting for running backups."""
+        with self._executor_lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=True)
+
     def _get_timeout(self, name: str) -> int:
         """Get timeout value from config with fallback to module constant."""
         defaults = {
@@ -327,6 +426,15 @@ class BackupEngine(
             if str(resolved) == prefix or str(resolved).startswith(prefix + "/"):
                 raise ValueError(f"Restore target '{resolved}' is inside a protected system directory.")
 
+    @staticmethod
+    def _validate_tar_member(member: tarfile.TarInfo, target: Path) -> None:
+        """Reject tar members with absolute paths or '..' components that escape target."""
+        if os.path.isabs(member.name) or ".." in Path(member.name).parts:
+            raise ValueError(f"Tar member '{member.name}' would extract outside target directory")
+        member_path = (target / member.name).resolve()
+        if not str(member_path).startswith(str(target) + os.sep) and member_path != target:
+            raise ValueError(f"Tar member '{member.name}' would extract outside target directory")
+
     @staticmethod
     def _safe_extractall(tar: tarfile.TarFile, path: str):
         """Safely extract all members from a tar archive, preventing path traversal.
@@ -337,12 +445,7 @@ class BackupEngine(
         target = Path(path).resolve()
         safe_members = []
         for member in tar.getmembers():
-            # Reject absolute paths and '..' components
-            if os.path.isabs(member.name) or ".." in Path(member.name).parts:
-                raise ValueError(f"Tar member '{member.name}' would extract outside target directory")
-            member_path = (target / member.name).resolve()
-            if not str(member_path).startswith(str(target) + os.sep) and member_path != target:
-                raise ValueError(f"Tar member '{member.name}' would extract outside target directory")
+            BackupEngine._validate_tar_member(member, target)
             safe_members.append(member)
 
         if sys.version_info >= (3, 12):
@@ -351,23 +454,31 @@ class BackupEngine(
             tar.extractall(path, members=safe_members)  # noqa: S202  # nosec B202
 
     @staticmethod
-    def _compile_exclude_patterns(patterns: list[str]) -> list[re.Pattern]:
-        """Convert glob/string exclusion patterns to compiled regexes.
+    def _safe_extract_stream(tar: tarfile.TarFile, path: str) -> None:
+        """Safely extract a streaming ("r|") tar archive member by member.
+
+        A stream can't be rewound for a validation pass, so each member is
+        checked with the same rules as _safe_extractall right before extraction.
+        """
+        target = Path(path).resolve()
+        for member in tar:
+            BackupEngine._validate_tar_member(member, target)
+            if sys.version_info >= (3, 12):
+                tar.extract(member, path, filter="data")  # nosec B202
+            else:
+                tar.extract(member, path)  # nosec B202
+
+    @staticmethod
+    def _compile_exclude_patterns(patterns: list[str]) -> re.Pattern[str]:
+        """Convert glob/string exclusion patterns to one compiled regex.
 
         Args:
             patterns: List of glob or string patterns
 
         Returns:
-            List of compiled regex patterns
+            Compiled regex matching any of the patterns
         """
-        regexes = []
-        for pattern in patterns:
-            if any(c in pattern for c in ["*", "?", "["]):
-                regex_pattern = fnmatch.translate(pattern)
-            else:
-                regex_pattern = f".*{re.escape(pattern)}.*"
-            regexes.append(re.compile(regex_pattern))
-        return regexes
+        return _compile_globs(tuple(sorted(patterns)), substring_plain=True)
 
     def _has_backup_today(self, backup_dir: Path, name_prefix: str) -> bool:
         """Check if a backup was already created today
@@ -426,6 +537,20 @@ class BackupEngine(
             self.logger.warning(f"Could not check disk space: {e}")
             return True, "Disk space check skipped (error occurred)"
 
+    def _disk_is_plentiful(self, path: Path) -> bool:
+        """Check whether free space at path exceeds the estimator skip threshold.
+
+        When it does, the pre-backup size estimate (a full directory walk) is
+        not worth its cost and callers can start archiving right away.
+        """
+        threshold = int(self.config.get_setting("skip_estimator_free_bytes", SKIP_ESTIMATOR_FREE_BYTES))
+        try:
+            stat = os.statvfs(path)
+        except OSError as e:
+            self.logger.debug("Could not stat filesystem for %s: %s", path, e)
+            return False
+        return stat.f_bavail * stat.f_frsize > threshold
+
     def _estimate_project_size(self, project_path: Path, exclude_patterns: list[str]) -> int:
         """Estimate the size of a project directory
 
@@ -438,7 +563,7 @@ class BackupEngine(
         """
         total_size = 0
 
-        exclude_regexes = self._compile_exclude_patterns(exclude_patterns)
+        exclude_regex = self._compile_exclude_patterns(exclude_patterns)
 
         try:
             for item in project_path.rglob("*"):
@@ -456,7 +581,7 @@ class BackupEngine(
                 # Also check compiled regex patterns
                 if not should_exclude:
                     item_str = str(item.relative_to(project_path.parent))
-                    should_exclude = any(regex.match(item_str) for regex in exclude_regexes)
+                    should_exclude = exclude_regex.match(item_str) is not None
 
                 if not should_exclude and item.is_file():
                     try:
@@ -472,8 +597,4 @@ class BackupEngine(
     @staticmethod
     def _backup_name_to_meta_name(backup_filename: str) -> str:
         """Convert a backup filename to its companion metadata filename."""
-        for ext in (".tar.gz", ".sql.gz", ".bundle"):
-            if backup_filename.endswith(ext):
-                return backup_filename[: -len(ext)] + ".json"
-        # Fallback: strip last extension
-        return backup_filename.rsplit(".", 1)[0] + ".json"
+        return metadata_filename(backup_filename)
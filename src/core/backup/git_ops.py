@@ -3,7 +3,7 @@
 import logging
 import shutil
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -64,7 +64,7 @@ class GitBackupMixin:
         if skip_if_exists_today and self._has_backup_today(local_backup_dir, project_name):
             return True, "Skipped: git backup already exists for today"
 
-        local_backup_path = None
+        local_backup_path: Path | None = None
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_name = f"{project_name}_{timestamp}.bundle"
@@ -159,22 +159,21 @@ class GitBackupMixin:
             for project_name in git_projects:
                 results[project_name] = self.backup_git(project_name, skip_if_exists_today=skip_if_exists_today)
         else:
-            max_workers = self.config.get_setting("system.max_parallel_backups", 4)
             self.logger.info("Starting parallel git backup of %s projects", len(git_projects))
 
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_project = {
-                    executor.submit(self.backup_git, project_name, None, skip_if_exists_today): project_name
-                    for project_name in git_projects
-                }
-
-                for future in as_completed(future_to_project):
-                    project_name = future_to_project[future]
-                    try:
-                        results[project_name] = future.result()
-                    except Exception as e:
-                        self.logger.error("Git backup failed for '%s': %s", project_name, e)
-                        results[project_name] = (False, f"Git backup failed: {e!s}")
+            executor = self._get_executor()
+            future_to_project = {
+                executor.submit(self.backup_git, project_name, None, skip_if_exists_today): project_name
+                for project_name in git_projects
+            }
+
+            for future in as_completed(future_to_project):
+                project_name = future_to_project[future]
+                try:
+                    results[project_name] = future.result()
+                except Exception as e:
+                    self.logger.error("Git backup failed for '%s': %s", project_name, e)
+                    results[project_name] = (False, f"Git backup failed: {e!s}")
 
         return results
 
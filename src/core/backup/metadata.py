@@ -1,35 +1,97 @@
 """Metadata, checksum, verification, and tagging operations for backups."""
 
+import functools
+import gzip
 import hashlib
+import heapq
 import json
 import logging
+import mmap
 import os
+import re
 import tempfile
+import zlib
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, cast
 
+from .constants import BYTES_PER_MB, CHECKSUM_CHUNK_SIZE
 
+# blake3 (optional) hashes large backups with SIMD on multiple threads
+try:
+    import blake3
+
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# orjson parses metadata several times faster than the stdlib when installed
+try:
+    import orjson
+
+    _json_loads: Any = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+@functools.lru_cache(maxsize=8192)
 def metadata_filename(backup_name: str) -> str:
-    """Derive the metadata JSON filename from a backup filename."""
+    """Derive the metadata JSON filename from a backup filename (memoized for retention sweeps)."""
     for ext in (".tar.gz", ".sql.gz", ".bundle"):
         if backup_name.endswith(ext):
             return backup_name[: -len(ext)] + ".json"
     return Path(backup_name).stem + ".json"
 
 
-def _atomic_json_write(path: Path, data: dict) -> None:
+# Machine-written sidecars skip indentation: smaller files, fewer bytes to write
+_COMPACT_JSON: dict[str, Any] = {"separators": (",", ":")}
+_PRETTY_JSON: dict[str, Any] = {"indent": 2}
+
+# Recorded as created_by / checksum_added_by on sidecars written by backfill_checksums
+_BACKFILL_CREATOR = "Backfill Operation"
+
+
+def _atomic_json_write(path: Path, data: dict, compact: bool = False) -> None:
     """Write JSON atomically: write to temp file, then rename."""
     fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
     try:
         with os.fdopen(fd, "w") as f:
-            json.dump(data, f, indent=2)
+            json.dump(data, f, **(_COMPACT_JSON if compact else _PRETTY_JSON))
         os.replace(tmp, path)
     except BaseException:
         os.unlink(tmp)
         raise
 
 
+class _HashingReader:
+    """Read-through wrapper that feeds every byte read into a hasher.
+
+    Lets a restore verify the archive checksum in the same pass that
+    decompresses it, instead of hashing the file separately first.
+    """
+
+    def __init__(self, fileobj: IO[bytes], algorithm: str) -> None:
+        self._fileobj = fileobj
+        if algorithm == "blake3":
+            self._hasher: Any = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        else:
+            self._hasher = hashlib.new(algorithm)
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self._hasher.update(data)
+        return data
+
+    def drain(self) -> None:
+        """Hash whatever the consumer left unread (gzip trailer, tar padding)."""
+        while self.read(CHECKSUM_CHUNK_SIZE):
+            pass
+
+    def hexdigest(self) -> str:
+        digest: str = self._hasher.hexdigest()
+        return digest
+
+
 class MetadataMixin:
     """Mixin providing metadata, checksum, verification, and tagging methods.
 
@@ -42,6 +104,48 @@ class MetadataMixin:
     config: Any
     logger: logging.Logger
     local_path: Path
+    _meta_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]]
+
+    def _load_metadata(self, metadata_path: Path) -> dict[str, Any]:
+        """Load a metadata sidecar, reusing the parsed copy while mtime and size are unchanged.
+
+        Returns a shallow copy so callers can add or replace top-level keys freely.
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read
+            ValueError: If the file is not valid JSON
+        """
+        st = metadata_path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._meta_cache.get(metadata_path)
+        if cached is None or cached[0] != key:
+            cached = (key, _json_loads(metadata_path.read_bytes()))
+            self._meta_cache[metadata_path] = cached
+        return dict(cached[1])
+
+    def _load_metadata_if(self, metadata_path: Path, prefilter: re.Pattern[bytes]) -> dict[str, Any] | None:
+        """Like _load_metadata, but skip parsing when the raw bytes don't match prefilter.
+
+        A cached entry is returned as-is. Otherwise the file is read and only
+        parsed (and cached) when prefilter finds a match; None means no match.
+        """
+        st = metadata_path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._meta_cache.get(metadata_path)
+        if cached is not None and cached[0] == key:
+            return dict(cached[1])
+        raw = metadata_path.read_bytes()
+        if prefilter.search(raw) is None:
+            return None
+        metadata = _json_loads(raw)
+        self._meta_cache[metadata_path] = (key, metadata)
+        return dict(metadata)
+
+    def _save_metadata(self, metadata_path: Path, metadata: dict[str, Any], compact: bool = False) -> None:
+        """Write a metadata sidecar atomically and refresh its cache entry."""
+        _atomic_json_write(metadata_path, metadata, compact)
+        st = metadata_path.stat()
+        self._meta_cache[metadata_path] = ((st.st_mtime_ns, st.st_size), dict(metadata))
 
     def _calculate_file_checksum(self, file_path: Path, algorithm: str = "sha256") -> str:
         """Calculate checksum of a file
@@ -54,12 +158,43 @@ class MetadataMixin:
             Hexadecimal checksum string
         """
         hash_obj = hashlib.new(algorithm)
-        with open(file_path, "rb") as f:
-            # Read in chunks to handle large files efficiently
-            for chunk in iter(lambda: f.read(8192), b""):
-                hash_obj.update(chunk)
+        with open(file_path, "rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return hash_obj.hexdigest()  # mmap can't map an empty file
+
+            # Hash slices of the mapped file directly, without copying chunks into bytes objects
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except OSError:
+                # Some network/FUSE filesystems can't be mapped: readinto a reused buffer
+                buf = bytearray(CHECKSUM_CHUNK_SIZE)
+                with memoryview(buf) as view:
+                    while n := f.readinto(buf):
+                        hash_obj.update(view[:n])
+                return hash_obj.hexdigest()
+            with mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mm) as view:
+                    for offset in range(0, size, CHECKSUM_CHUNK_SIZE):
+                        hash_obj.update(view[offset : offset + CHECKSUM_CHUNK_SIZE])
         return hash_obj.hexdigest()
 
+    def _calculate_blake3_checksum(self, file_path: Path) -> str:
+        """Calculate the BLAKE3 checksum of a file (requires the blake3 package)
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            Hexadecimal checksum string
+        """
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        hasher.update_mmap(str(file_path))
+        digest: str = hasher.hexdigest()
+        return digest
+
     def _create_backup_metadata(
         self,
         backup_dir: Path,
@@ -77,10 +212,13 @@ class MetadataMixin:
 
         # Calculate checksum - MANDATORY for new backups
         checksum = None
+        checksum_blake3 = None
         if backup_file_path and backup_file_path.exists():
             try:
                 checksum = self._calculate_file_checksum(backup_file_path)
                 self.logger.info("Calculated SHA256 checksum for %s: %s...", backup_name, checksum[:8])
+                if BLAKE3_AVAILABLE:
+                    checksum_blake3 = self._calculate_blake3_checksum(backup_file_path)
             except Exception as e:
                 # This is now a critical error - we MUST have checksums for data integrity
                 self.logger.error("CRITICAL: Failed to calculate checksum for %s: %s", backup_name, e)
@@ -98,7 +236,7 @@ class MetadataMixin:
             "description": description,
             "timestamp": datetime.now().isoformat(),
             "size_bytes": size_bytes,
-            "size_mb": round(size_bytes / (1024 * 1024), 2),
+            "size_mb": round(size_bytes / BYTES_PER_MB, 2),
             "checksum_sha256": checksum,
             "created_by": "Quartermaster",
             "version": "1.0",
@@ -109,6 +247,14 @@ class MetadataMixin:
             "pinned": False,  # Alternative to keep_forever
         }
 
+        # BLAKE3 lets verify_backup skip the slower SHA256 pass when blake3 is installed
+        if checksum_blake3:
+            metadata["checksum_blake3"] = checksum_blake3
+
+        # Lets the "fast" verify mode recognise an untouched file without reading it
+        if backup_file_path:
+            metadata["mtime_ns"] = backup_file_path.stat().st_mtime_ns
+
         # Add any extra metadata
         if extra_metadata:
             metadata.update(extra_metadata)
@@ -120,13 +266,18 @@ class MetadataMixin:
             self.logger.error("Failed to create metadata file: %s", e)
             raise RuntimeError(f"Failed to create backup metadata: {e}") from e
 
-    def verify_backup(self, item_type: str, item_name: str, backup_file: str) -> tuple[bool, str]:
+    def verify_backup(
+        self, item_type: str, item_name: str, backup_file: str, quick: bool | None = None
+    ) -> tuple[bool, str]:
         """Verify backup integrity by comparing checksums
 
         Args:
             item_type: 'project', 'database', or 'git'
             item_name: Name of the project or database
             backup_file: Backup filename to verify
+            quick: Skip recomputing the checksum; None follows the system.verify_mode
+                setting ("fast" trusts an unchanged size and mtime, "quick" checks
+                only the gzip CRC32), False always hashes the whole file
 
         Returns:
             Tuple of (success, message)
@@ -153,16 +304,47 @@ class MetadataMixin:
             return False, f"Metadata file not found: {metadata_name}"
 
         try:
-            with open(metadata_path) as f:
-                metadata = json.load(f)
+            metadata = self._load_metadata(metadata_path)
 
-            stored_checksum = metadata.get("checksum_sha256")
-            if not stored_checksum:
+            selected = self._select_checksum(metadata)
+            if selected is None:
+                if metadata.get("checksum_blake3"):
+                    return False, "Only a BLAKE3 checksum is recorded; verifying it requires the blake3 package"
                 return False, "No checksum found in metadata (backup created before verification feature)"
+            algorithm, stored_checksum = selected
+
+            # A truncated or padded file fails on size alone; skip hashing it
+            stored_size = metadata.get("size_bytes")
+            file_stats = backup_path.stat()
+            actual_size = file_stats.st_size
+            if stored_size is not None and stored_size != actual_size:
+                self.logger.error("Verification failed for %s: size mismatch", backup_file)
+                return (
+                    False,
+                    f"✗ Backup corrupted! Size mismatch.\nExpected: {stored_size} bytes\nActual: {actual_size} bytes",
+                )
+
+            if quick is None:
+                verify_mode = self.config.get_setting("system.verify_mode", "full")
+            else:
+                verify_mode = "quick" if quick else "full"
+            if verify_mode == "fast" and self._stat_unchanged(metadata, file_stats):
+                self.logger.info("Verification successful for %s (size and mtime unchanged)", backup_file)
+                return True, "✓ Backup verified successfully (size and mtime unchanged)"
+            if verify_mode == "quick" and backup_file.endswith(".gz"):
+                self.logger.info("Quick-verifying backup: %s", backup_file)
+                try:
+                    self._check_gzip_integrity(backup_path)
+                except (OSError, EOFError, zlib.error) as e:
+                    self.logger.error("Verification failed for %s: %s", backup_file, e)
+                    return False, f"✗ Backup corrupted! Compressed stream is damaged.\n{e}"
+                return True, "✓ Backup verified successfully (gzip CRC matches)"
+
+            checksum_fn = self._calculate_blake3_checksum if algorithm == "blake3" else self._calculate_file_checksum
 
             # Calculate current checksum
             self.logger.info("Verifying backup: %s", backup_file)
-            current_checksum = self._calculate_file_checksum(backup_path)
+            current_checksum = checksum_fn(backup_path)
 
             if current_checksum == stored_checksum:
                 self.logger.info("Verification successful for %s", backup_file)
@@ -178,6 +360,55 @@ class MetadataMixin:
             self.logger.error("Failed to verify backup %s: %s", backup_file, e, exc_info=True)
             return False, f"Verification failed: {e!s}"
 
+    @staticmethod
+    def _stat_unchanged(metadata: dict[str, Any], file_stats: os.stat_result) -> bool:
+        """Whether a backup still has the size and mtime recorded when its checksum was taken.
+
+        Sidecars written before mtime_ns was recorded never match, so they are hashed.
+        """
+        return metadata.get("mtime_ns") == file_stats.st_mtime_ns and metadata.get("size_bytes") == file_stats.st_size
+
+    @staticmethod
+    def _check_gzip_integrity(path: Path) -> None:
+        """Decompress a gzip file to the end so its CRC32 and length trailer are checked.
+
+        Raises:
+            OSError, EOFError or zlib.error when the stream is damaged or truncated
+        """
+        with gzip.open(path, "rb") as f:
+            while f.read(CHECKSUM_CHUNK_SIZE):
+                pass
+
+    @staticmethod
+    def _select_checksum(metadata: dict[str, Any]) -> tuple[str, str] | None:
+        """Pick the checksum to verify against: BLAKE3 when both the metadata and
+        the library have it, otherwise SHA-256.
+
+        Returns:
+            Tuple of (algorithm, expected hex digest), or None if metadata has no checksum
+        """
+        if BLAKE3_AVAILABLE and metadata.get("checksum_blake3"):
+            return "blake3", metadata["checksum_blake3"]
+        if metadata.get("checksum_sha256"):
+            return "sha256", metadata["checksum_sha256"]
+        return None
+
+    def _expected_checksum(self, backup_path: Path) -> tuple[str, str] | None:
+        """Load the checksum recorded in a backup's metadata sidecar.
+
+        Args:
+            backup_path: Path to the backup file
+
+        Returns:
+            Tuple of (algorithm, expected hex digest), or None if the sidecar is
+            missing, unreadable, or has no checksum
+        """
+        try:
+            metadata = self._load_metadata(backup_path.parent / metadata_filename(backup_path.name))
+        except (OSError, ValueError):
+            return None
+        return self._select_checksum(metadata)
+
     def verify_all_backups(self, item_type: str, item_name: str) -> dict[str, tuple[bool, str]]:
         """Verify all backups for a project, database, or git repo
 
@@ -188,8 +419,6 @@ class MetadataMixin:
         Returns:
             Dictionary mapping backup filenames to (success, message) tuples
         """
-        results = {}
-
         # Get backup directory
         if item_type == "project":
             backup_dir = self.local_path / "projects" / item_name
@@ -204,26 +433,37 @@ class MetadataMixin:
             return {"error": (False, f"No backups found for {item_name}")}
 
         # Find all backup files
-        backup_files = []
-        if item_type == "project":
-            backup_files = list(backup_dir.glob("*.tar.gz"))
-        elif item_type == "database":
-            backup_files = list(backup_dir.glob("*.sql.gz"))
-        elif item_type == "git":
-            backup_files = list(backup_dir.glob("*.bundle"))
-
-        backup_files = [b for b in backup_files if not b.is_symlink()]
+        suffix = {"project": ".tar.gz", "database": ".sql.gz", "git": ".bundle"}[item_type]
+        backup_files = self._scan_backup_files(backup_dir, suffix)
 
         if not backup_files:
             return {"error": (False, f"No backups found for {item_name}")}
 
         self.logger.info("Verifying %s backups for %s...", len(backup_files), item_name)
 
-        for backup_file in backup_files:
-            success, message = self.verify_backup(item_type, item_name, backup_file.name)
-            results[backup_file.name] = (success, message)
+        # Hash several archives at once so the disk queue stays full
+        names = [b.name for b in backup_files]
+        verified = self._get_executor("checksum").map(
+            lambda name: self.verify_backup(item_type, item_name, name), names
+        )
+        return dict(zip(names, verified, strict=True))
 
-        return results
+    @staticmethod
+    def _scan_backup_files(backup_dir: Path, suffix: str) -> list[Path]:
+        """List the non-symlink backup files in a directory with a single read.
+
+        DirEntry answers is_symlink() from the directory listing's d_type,
+        so unlike glob() followed by Path.is_symlink() no per-file lstat is issued.
+
+        Args:
+            backup_dir: Directory containing the backups
+            suffix: Backup file suffix, e.g. ".tar.gz"
+
+        Returns:
+            Paths of matching backup files
+        """
+        with os.scandir(backup_dir) as it:
+            return [Path(e.path) for e in it if e.name.endswith(suffix) and not e.is_symlink()]
 
     def get_backup_status(self, item_type: str, item_name: str) -> dict[str, Any]:
         """Get backup status for a project, database, or git backup"""
@@ -238,38 +478,43 @@ class MetadataMixin:
             return {"exists": False, "backup_count": 0, "total_size": 0, "latest_backup": None}
 
         # Different file patterns for different types
-        if item_type == "git":
-            backups = list(backup_dir.glob("*.bundle"))
-        else:
-            backups = list(backup_dir.glob("*.tar.gz")) + list(backup_dir.glob("*.sql.gz"))
-        backups = [b for b in backups if not b.is_symlink()]
+        suffixes = (".bundle",) if item_type == "git" else (".tar.gz", ".sql.gz")
+
+        # One scandir pass: (name, size, mtime) per backup, stat'ed once
+        backups = []
+        with os.scandir(backup_dir) as it:
+            for entry in it:
+                if entry.name.endswith(suffixes) and not entry.is_symlink():
+                    st = entry.stat(follow_symlinks=False)
+                    backups.append((entry.name, st.st_size, st.st_mtime))
 
         if not backups:
             return {"exists": True, "backup_count": 0, "total_size": 0, "latest_backup": None}
 
-        backups.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-        latest = backups[0]
+        # Only the newest 10 are reported, so a partial sort is enough
+        recent = heapq.nlargest(10, backups, key=lambda b: b[2])
+        latest_name, latest_size, latest_mtime = recent[0]
 
-        total_size = sum(b.stat().st_size for b in backups)
+        total_size = sum(b[1] for b in backups)
 
         return {
             "exists": True,
             "backup_count": len(backups),
             "total_size": total_size,
-            "total_size_mb": total_size / (1024 * 1024),
+            "total_size_mb": total_size / BYTES_PER_MB,
             "latest_backup": {
-                "name": latest.name,
-                "size": latest.stat().st_size,
-                "size_mb": latest.stat().st_size / (1024 * 1024),
-                "modified": datetime.fromtimestamp(latest.stat().st_mtime).isoformat(),
+                "name": latest_name,
+                "size": latest_size,
+                "size_mb": latest_size / BYTES_PER_MB,
+                "modified": datetime.fromtimestamp(latest_mtime).isoformat(),
             },
             "all_backups": [
                 {
-                    "name": b.name,
-                    "size_mb": b.stat().st_size / (1024 * 1024),
-                    "modified": datetime.fromtimestamp(b.stat().st_mtime).isoformat(),
+                    "name": name,
+                    "size_mb": size / BYTES_PER_MB,
+                    "modified": datetime.fromtimestamp(mtime).isoformat(),
                 }
-                for b in backups[:10]  # Last 10 backups
+                for name, size, mtime in recent  # Last 10 backups
             ],
         }
 
@@ -317,8 +562,7 @@ class MetadataMixin:
 
         if metadata_path.exists():
             try:
-                with open(metadata_path) as f:
-                    metadata = json.load(f)
+                metadata = self._load_metadata(metadata_path)
             except Exception as e:
                 return False, f"Failed to read metadata: {e}"
         else:
@@ -330,7 +574,7 @@ class MetadataMixin:
                 "item_type": item_type,
                 "timestamp": datetime.fromtimestamp(file_stats.st_mtime).isoformat(),
                 "size_bytes": file_stats.st_size,
-                "size_mb": round(file_stats.st_size / (1024 * 1024), 2),
+                "size_mb": round(file_stats.st_size / BYTES_PER_MB, 2),
                 "created_by": "Manual Tag Operation",
                 "version": "1.0",
             }
@@ -359,7 +603,7 @@ class MetadataMixin:
 
         # Save updated metadata
         try:
-            _atomic_json_write(metadata_path, metadata)
+            self._save_metadata(metadata_path, metadata)
 
             tag_summary = []
             if tags:
@@ -390,67 +634,120 @@ class MetadataMixin:
         """
         tagged_backups = []
 
-        # Determine directories to search
+        # Determine directories to search (scandir reports entry types without a stat per entry)
         search_dirs = []
-        if item_type in ["project", None]:
-            projects_dir = self.local_path / "projects"
+        for type_name, subdir in (("project", "projects"), ("database", "databases"), ("git", "git")):
+            if item_type not in [type_name, None]:
+                continue
+            base_dir = self.local_path / subdir
             if item_name:
-                specific_dir = projects_dir / item_name
+                specific_dir = base_dir / item_name
                 if specific_dir.exists():
-                    search_dirs.append(("project", item_name, specific_dir))
-            else:
-                for project_dir in projects_dir.glob("*/"):
-                    if project_dir.is_dir():
-                        search_dirs.append(("project", project_dir.name, project_dir))
+                    search_dirs.append((type_name, item_name, specific_dir))
+                continue
+            try:
+                with os.scandir(base_dir) as it:
+                    search_dirs.extend((type_name, e.name, Path(e.path)) for e in it if e.is_dir())
+            except FileNotFoundError:
+                continue
+
+        # Each directory keeps a columnar index of sidecar stamps and the tagged
+        # subset, so only sidecars written since the last listing are read again
+        indexes: list[tuple[str, str, Path, list[str], list[list[int]], dict[str, Any], bool]] = []
+        to_read: list[tuple[int, str, Path]] = []
+        for type_name, name, directory in search_dirs:
+            cached = self._load_tag_index(directory)
+            known = dict(zip(cached["names"], cached["stamps"], strict=True))
+            names: list[str] = []
+            stamps: list[list[int]] = []
+            # Hidden files are incremental snapshots, not backup metadata
+            with os.scandir(directory) as it:
+                for e in it:
+                    if e.name.endswith(".json") and not e.name.startswith(".") and e.is_file():
+                        st = e.stat()
+                        names.append(e.name)
+                        stamps.append([st.st_mtime_ns, st.st_size])
+            tagged = {n: cached["tagged"][n] for n in names if n in cached["tagged"]}
+            changed = len(names) != len(known)
+            for n, stamp in zip(names, stamps, strict=True):
+                if known.get(n) != stamp:
+                    tagged.pop(n, None)
+                    to_read.append((len(indexes), n, directory / n))
+                    changed = True
+            indexes.append((type_name, name, directory, names, stamps, tagged, changed))
+
+        # Read changed sidecars on the shared pool so per-file open latency (slow disks, NFS) overlaps
+        results = self._get_executor().map(self._read_tagged_metadata, [c[2] for c in to_read])
+        for (slot, n, _), metadata in zip(to_read, results, strict=True):
+            _, _, _, names, stamps, tagged, _ = indexes[slot]
+            if metadata is None:
+                # Unreadable: record an impossible stamp so the next listing retries it
+                stamps[names.index(n)] = [-1, -1]
+            elif metadata:
+                tagged[n] = metadata
+
+        for type_name, name, directory, names, stamps, tagged, changed in indexes:
+            if changed:
+                self._save_tag_index(directory, {"names": names, "stamps": stamps, "tagged": tagged})
+            for metadata in tagged.values():
+                tagged_backups.append({**metadata, "item_type": type_name, "item_name": name})
 
-        if item_type in ["database", None]:
-            databases_dir = self.local_path / "databases"
-            if item_name:
-                specific_dir = databases_dir / item_name
-                if specific_dir.exists():
-                    search_dirs.append(("database", item_name, specific_dir))
-            else:
-                for db_dir in databases_dir.glob("*/"):
-                    if db_dir.is_dir():
-                        search_dirs.append(("database", db_dir.name, db_dir))
+        # Sort by timestamp (newest first)
+        tagged_backups.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+        return tagged_backups
 
-        if item_type in ["git", None]:
-            git_dir = self.local_path / "git"
-            if item_name:
-                specific_dir = git_dir / item_name
-                if specific_dir.exists():
-                    search_dirs.append(("git", item_name, specific_dir))
-            else:
-                for repo_dir in git_dir.glob("*/"):
-                    if repo_dir.is_dir():
-                        search_dirs.append(("git", repo_dir.name, repo_dir))
+    def _read_tagged_metadata(self, metadata_file: Path) -> dict[str, Any] | None:
+        """Load a metadata sidecar and return it only if the backup is tagged.
 
-        # Search for tagged backups
-        for type_name, name, directory in search_dirs:
-            for metadata_file in directory.glob("*.json"):
-                try:
-                    with open(metadata_file) as f:
-                        metadata = json.load(f)
+        Args:
+            metadata_file: Path to the metadata JSON file
 
-                    # Check if backup is tagged
-                    is_tagged = (
-                        metadata.get("tags")
-                        or metadata.get("keep_forever", False)
-                        or metadata.get("pinned", False)
-                        or metadata.get("importance") not in [None, "normal"]
-                    )
+        Returns:
+            Metadata dict for tagged backups, an empty dict if untagged, None if unreadable
+        """
+        try:
+            metadata = self._load_metadata(metadata_file)
+        except Exception as e:
+            self.logger.warning("Could not read metadata file %s: %s", metadata_file, e)
+            return None
 
-                    if is_tagged:
-                        metadata["item_type"] = type_name
-                        metadata["item_name"] = name
-                        tagged_backups.append(metadata)
+        is_tagged = (
+            metadata.get("tags")
+            or metadata.get("keep_forever", False)
+            or metadata.get("pinned", False)
+            or metadata.get("importance") not in [None, "normal"]
+        )
+        return metadata if is_tagged else {}
 
-                except Exception as e:
-                    self.logger.warning("Could not read metadata file %s: %s", metadata_file, e)
+    def _tag_index_path(self, directory: Path) -> Path:
+        """Location of a backup directory's cached tag index under <local>/.cache/tagindex."""
+        relative = directory.resolve().relative_to(self.local_path.resolve())
+        return self.local_path / ".cache" / "tagindex" / relative.parent / f"{relative.name}.idx"
 
-        # Sort by timestamp (newest first)
-        tagged_backups.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-        return tagged_backups
+    def _load_tag_index(self, directory: Path) -> dict[str, Any]:
+        """Load a directory's tag index.
+
+        Returns:
+            Columns "names" and "stamps" ([mtime_ns, size] per sidecar) plus
+            "tagged", the metadata of tagged sidecars by name; empty when the
+            index is missing or unreadable
+        """
+        try:
+            index = _json_loads(self._tag_index_path(directory).read_bytes())
+            if len(index["names"]) == len(index["stamps"]) and isinstance(index["tagged"], dict):
+                return cast("dict[str, Any]", index)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing or unreadable: every sidecar is read
+        return {"names": [], "stamps": [], "tagged": {}}
+
+    def _save_tag_index(self, directory: Path, index: dict[str, Any]) -> None:
+        """Persist a directory's tag index; a failed write only costs a re-read next time."""
+        index_path = self._tag_index_path(directory)
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_json_write(index_path, index, compact=True)
+        except OSError as e:
+            self.logger.warning("Could not write tag index %s: %s", index_path, e)
 
     def backfill_checksums(self, item_type: str, item_name: str) -> tuple[int, int]:
         """Add checksums to old backups that don't have them
@@ -462,19 +759,16 @@ class MetadataMixin:
         Returns:
             Tuple of (updated_count, total_count)
         """
-        updated = 0
-        total = 0
-
         # Get backup directory
         if item_type == "project":
             backup_dir = self.local_path / "projects" / item_name
-            pattern = "*.tar.gz"
+            suffix = ".tar.gz"
         elif item_type == "database":
             backup_dir = self.local_path / "databases" / item_name
-            pattern = "*.sql.gz"
+            suffix = ".sql.gz"
         elif item_type == "git":
             backup_dir = self.local_path / "git" / item_name
-            pattern = "*.bundle"
+            suffix = ".bundle"
         else:
             return 0, 0
 
@@ -482,69 +776,97 @@ class MetadataMixin:
             return 0, 0
 
         # Find all backup files
-        backup_files = [f for f in backup_dir.glob(pattern) if not f.is_symlink()]
+        backup_files = self._scan_backup_files(backup_dir, suffix)
         total = len(backup_files)
 
-        for backup_file in backup_files:
-            # Check if metadata exists
-            metadata_name = self._backup_name_to_meta_name(backup_file.name)
-            metadata_path = backup_dir / metadata_name
+        # One timestamp and JSON style for the whole run instead of per file
+        added_at = datetime.now().isoformat()
+        compact = self._compact_backfill_json()
 
-            if metadata_path.exists():
-                try:
-                    with open(metadata_path) as f:
-                        metadata = json.load(f)
+        # Files are independent; hashing overlaps disk stalls and releases the GIL
+        executor = self._get_executor("checksum")
+        updated = sum(
+            executor.map(lambda f: self._backfill_one(f, item_type, item_name, added_at, compact), backup_files)
+        )
 
-                    # Check if checksum is missing or None
-                    if not metadata.get("checksum_sha256"):
-                        self.logger.info("Calculating checksum for %s...", backup_file.name)
+        return updated, total
 
-                        # Calculate checksum
-                        checksum = self._calculate_file_checksum(backup_file)
+    def _compact_backfill_json(self) -> bool:
+        """Backfilled sidecars are machine-written; keep them compact unless system.pretty_json is set."""
+        return not self.config.get_setting("system.pretty_json", False)
 
-                        # Update metadata
-                        metadata["checksum_sha256"] = checksum
-                        metadata["checksum_added"] = datetime.now().isoformat()
-                        metadata["checksum_added_by"] = "Backfill Operation"
+    def _backfill_one(self, backup_file: Path, item_type: str, item_name: str, added_at: str, compact: bool) -> bool:
+        """Add a checksum to one backup's metadata, creating the sidecar if missing.
 
-                        # Save updated metadata
-                        _atomic_json_write(metadata_path, metadata)
+        Args:
+            backup_file: Path to the backup file
+            item_type: 'project', 'database', or 'git'
+            item_name: Name of the project or database
+            added_at: ISO timestamp recorded as checksum_added
+            compact: Write the sidecar without indentation
 
-                        self.logger.info("Added checksum to %s: %s...", metadata_name, checksum[:8])
-                        updated += 1
+        Returns:
+            True if metadata was written
+        """
+        # Check if metadata exists
+        metadata_name = self._backup_name_to_meta_name(backup_file.name)
+        metadata_path = backup_file.parent / metadata_name
 
-                except Exception as e:
-                    self.logger.error("Failed to update metadata for %s: %s", backup_file.name, e)
-            else:
-                # Create metadata if it doesn't exist
-                try:
-                    self.logger.info("Creating metadata for %s...", backup_file.name)
+        if metadata_path.exists():
+            try:
+                metadata = self._load_metadata(metadata_path)
+
+                # Check if checksum is missing (BLAKE3-only sidecars get SHA-256 added too)
+                if not metadata.get("checksum_sha256"):
+                    self.logger.info("Calculating checksum for %s...", backup_file.name)
 
                     # Calculate checksum
                     checksum = self._calculate_file_checksum(backup_file)
-                    file_stats = backup_file.stat()
-
-                    # Create new metadata
-                    metadata = {
-                        "backup_name": backup_file.name,
-                        "item_name": item_name,
-                        "item_type": item_type,
-                        "description": None,
-                        "timestamp": datetime.fromtimestamp(file_stats.st_mtime).isoformat(),
-                        "size_bytes": file_stats.st_size,
-                        "size_mb": round(file_stats.st_size / (1024 * 1024), 2),
-                        "checksum_sha256": checksum,
-                        "created_by": "Backfill Operation",
-                        "version": "1.0",
-                    }
-
-                    # Save metadata
-                    _atomic_json_write(metadata_path, metadata)
-
-                    self.logger.info("Created metadata for %s with checksum: %s...", backup_file.name, checksum[:8])
-                    updated += 1
-
-                except Exception as e:
-                    self.logger.error("Failed to create metadata for %s: %s", backup_file.name, e)
 
-        return updated, total
+                    # Update metadata
+                    metadata["checksum_sha256"] = checksum
+                    metadata["checksum_added"] = added_at
+                    metadata["checksum_added_by"] = _BACKFILL_CREATOR
+
+                    # Save updated metadata
+                    self._save_metadata(metadata_path, metadata, compact=compact)
+
+                    self.logger.info("Added checksum to %s: %s...", metadata_name, checksum[:8])
+                    return True
+
+            except Exception as e:
+                self.logger.error("Failed to update metadata for %s: %s", backup_file.name, e)
+            return False
+
+        # Create metadata if it doesn't exist
+        try:
+            self.logger.info("Creating metadata for %s...", backup_file.name)
+
+            # Calculate checksum
+            checksum = self._calculate_file_checksum(backup_file)
+            file_stats = backup_file.stat()
+
+            # Create new metadata
+            metadata = {
+                "backup_name": backup_file.name,
+                "item_name": item_name,
+                "item_type": item_type,
+                "description": None,
+                "timestamp": datetime.fromtimestamp(file_stats.st_mtime).isoformat(),
+                "size_bytes": file_stats.st_size,
+                "size_mb": round(file_stats.st_size / BYTES_PER_MB, 2),
+                "mtime_ns": file_stats.st_mtime_ns,
+                "checksum_sha256": checksum,
+                "created_by": _BACKFILL_CREATOR,
+                "version": "1.0",
+            }
+
+            # Save metadata
+            self._save_metadata(metadata_path, metadata, compact=compact)
+
+            self.logger.info("Created metadata for %s with checksum: %s...", backup_file.name, checksum[:8])
+            return True
+
+        except Exception as e:
+            self.logger.error("Failed to create metadata for %s: %s", backup_file.name, e)
+            return False
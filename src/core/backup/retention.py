@@ -1,11 +1,32 @@
 """Retention and cleanup operations for backups."""
 
-import json
+import fnmatch
 import logging
+import os
+import re
+from collections.abc import Callable
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+# Matches metadata that may preserve a backup: pinned, critical/high importance,
+# or a non-empty tag list. Whitespace-tolerant so indented and compact JSON both match.
+_PRESERVE_MARKERS_RE = re.compile(
+    rb'"(?:keep_forever|pinned)"\s*:\s*true|"importance"\s*:\s*"(?:critical|high)"|"tags"\s*:\s*\[\s*[^\]\s]'
+)
+
+
+def _pattern_matcher(patterns: list[str]) -> Callable[[str], bool]:
+    """Build a name predicate for backup glob patterns.
+
+    Plain "*<suffix>" patterns (the only kind callers pass) collapse to a
+    single str.endswith over a tuple; anything else falls back to fnmatch.
+    """
+    if all(p.startswith("*") and not any(c in p[1:] for c in "*?[") for p in patterns):
+        suffixes = tuple(p[1:] for p in patterns)
+        return lambda name: name.endswith(suffixes)
+    return lambda name: any(fnmatch.fnmatchcase(name, p) for p in patterns)
+
 
 class RetentionMixin:
     """Mixin providing backup retention and cleanup methods.
@@ -21,6 +42,7 @@ class RetentionMixin:
     logger: logging.Logger
     local_path: Path
     sync_path: Path | None
+    _meta_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]]
 
     def _cleanup_old_backups(self, directory: Path, retention_days: int, patterns: list[str] | None = None):
         """Remove backups older than retention period (respecting tags and importance).
@@ -33,60 +55,63 @@ class RetentionMixin:
         if not directory.exists():
             return
 
-        cutoff_date = datetime.now() - timedelta(days=retention_days)
+        cutoff_ts = (datetime.now() - timedelta(days=retention_days)).timestamp()
+        important_tags = frozenset(
+            self.config.get_setting("retention.important_tags", ["production", "release", "stable", "live", "deployed"])
+        )
 
         if patterns is None:
             patterns = ["*.tar.gz", "*.sql.gz"]
 
-        for pattern in patterns:
-            for backup_file in directory.glob(pattern):
-                if backup_file.is_symlink():
-                    continue  # Skip symlinks
-
-                # Check if backup should be preserved based on metadata
-                metadata_name = self._backup_name_to_meta_name(backup_file.name)
-                metadata_path = directory / metadata_name
-
-                should_preserve = False
-                preserve_reason = None
-
-                if metadata_path.exists():
-                    try:
-                        with open(metadata_path) as f:
-                            metadata = json.load(f)
-
-                        # Check preservation criteria
-                        if metadata.get("keep_forever", False) or metadata.get("pinned", False):
-                            should_preserve = True
-                            preserve_reason = "pinned/keep_forever"
-                        elif metadata.get("importance") in ["critical", "high"]:
+        # One directory read; DirEntry caches the symlink check and stat
+        matches = _pattern_matcher(patterns)
+        with os.scandir(directory) as it:
+            entries = [e for e in it if matches(e.name) and not e.is_symlink()]
+
+        for entry in entries:
+            backup_file = Path(entry.path)
+
+            # Check if backup should be preserved based on metadata
+            metadata_name = self._backup_name_to_meta_name(entry.name)
+            metadata_path = directory / metadata_name
+
+            should_preserve = False
+            preserve_reason = None
+
+            if metadata_path.exists():
+                try:
+                    # Most sidecars carry no preservation markers; skip parsing those
+                    metadata = self._load_metadata_if(metadata_path, _PRESERVE_MARKERS_RE) or {}
+
+                    # Check preservation criteria
+                    if metadata.get("keep_forever", False) or metadata.get("pinned", False):
+                        should_preserve = True
+                        preserve_reason = "pinned/keep_forever"
+                    elif metadata.get("importance") in ["critical", "high"]:
+                        should_preserve = True
+                        preserve_reason = f"importance={metadata.get('importance')}"
+                    elif metadata.get("tags"):
+                        # Preserve if has important tags
+                        if not important_tags.isdisjoint(metadata.get("tags", ())):
                             should_preserve = True
-                            preserve_reason = f"importance={metadata.get('importance')}"
-                        elif metadata.get("tags"):
-                            # Preserve if has important tags
-                            configured_tags = self.config.get_setting(
-                                "retention.important_tags", ["production", "release", "stable", "live", "deployed"]
-                            )
-                            important_tags = set(configured_tags)
-                            if any(tag in important_tags for tag in metadata.get("tags", [])):
-                                should_preserve = True
-                                preserve_reason = f"tags={metadata.get('tags')}"
-                    except Exception as e:
-                        self.logger.warning(f"Could not read metadata for {backup_file.name}: {e}")
-
-                # Skip if backup should be preserved
-                if should_preserve:
-                    self.logger.debug(f"Preserving {backup_file.name} ({preserve_reason})")
-                    continue
-
-                # Remove if older than retention period
-                if backup_file.stat().st_mtime < cutoff_date.timestamp():
-                    backup_file.unlink()
-
-                    # Also remove metadata file
-                    try:
-                        metadata_path.unlink()
-                    except FileNotFoundError:
-                        pass
-
-                    self.logger.info(f"Removed old backup: {backup_file.name}")
+                            preserve_reason = f"tags={metadata.get('tags')}"
+                except Exception as e:
+                    self.logger.warning(f"Could not read metadata for {entry.name}: {e}")
+
+            # Skip if backup should be preserved
+            if should_preserve:
+                self.logger.debug(f"Preserving {entry.name} ({preserve_reason})")
+                continue
+
+            # Remove if older than retention period
+            if entry.stat(follow_symlinks=False).st_mtime < cutoff_ts:
+                backup_file.unlink()
+
+                # Also remove metadata file
+                self._meta_cache.pop(metadata_path, None)
+                try:
+                    metadata_path.unlink()
+                except FileNotFoundError:
+                    pass
+
+                self.logger.info(f"Removed old backup: {entry.name}")
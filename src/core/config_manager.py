@@ -1,17 +1,91 @@
 """Configuration Manager for Quartermaster"""
 
+import copy
+import functools
 import logging
 import os
+from collections.abc import Callable, ItemsView, Iterator, ValuesView
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, ClassVar, cast
 
 import yaml
 from cryptography.fernet import Fernet
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@functools.lru_cache(maxsize=256)
+def _setting_path(key: str) -> tuple[str, ...]:
+    """Split a dotted setting key once; get_setting is called with a small fixed set of keys."""
+    return tuple(key.split("."))
+
+
+class _LazyDecryptedConfig(dict[str, Any]):
+    """Database config whose encrypted password is decrypted on first access.
+
+    Fernet decryption (HMAC-SHA256 + AES) is paid only by callers that read
+    the password, not by every listing. All read paths (indexing, get, items,
+    values, copy, dict()/** unpacking) return the decrypted value; the
+    plaintext is memoized in this copy only, never in the loaded config.
+    """
+
+    def __init__(self, config: dict[str, Any], decrypt: Callable[[str], str]) -> None:
+        super().__init__(config)
+        self._decrypt = decrypt
+
+    def __getitem__(self, key: str) -> Any:
+        value = super().__getitem__(key)
+        if key == "password" and isinstance(value, str) and value.startswith("enc:"):
+            value = self._decrypt(value)
+            super().__setitem__(key, value)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        # Overriding __iter__ makes dict() and ** unpacking go through __getitem__
+        return super().__iter__()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def items(self) -> ItemsView[str, Any]:  # type: ignore[override]
+        return ItemsView(self)
+
+    def values(self) -> ValuesView[Any]:  # type: ignore[override]
+        return ValuesView(self)
+
+    def copy(self) -> dict[str, Any]:
+        return dict(self)
+
+    def __eq__(self, other: object) -> bool:
+        # dict's C comparison reads raw storage; compare decrypted views instead
+        if not isinstance(other, dict):
+            return NotImplemented
+        return dict(self) == dict(other)
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __repr__(self) -> str:
+        # Mask without decrypting, so debug output never carries the plaintext
+        return repr({key: "***" if key == "password" else value for key, value in dict.items(self)})
+
 
 class ConfigManager:
     """Manages all configuration for the backup system"""
 
+    # Fernet ciphers by key file path, shared by every instance in the process
+    _cipher_cache: ClassVar[dict[Path, Fernet]] = {}
+    # Parsed YAML by path, tagged with the (mtime_ns, size) it was read at; the tree
+    # is None until the same unchanged file has been loaded twice
+    _yaml_cache: ClassVar[dict[Path, tuple[tuple[int, int], dict[str, Any] | None]]] = {}
+
     def __init__(self, config_dir: str | None = None):
         self.config_dir = Path(config_dir or Path(__file__).parent.parent.parent / "config")
         self.settings_file = self.config_dir / "settings.yaml"
@@ -52,6 +126,12 @@ class ConfigManager:
         """Initialize encryption for sensitive data"""
         key_file = self.config_dir / ".encryption_key"
 
+        # Repeat instances (CLI subcommands, tests) reuse the cipher without touching the key file
+        cached = ConfigManager._cipher_cache.get(key_file)
+        if cached is not None:
+            self.cipher = cached
+            return
+
         if key_file.exists():
             # Ensure correct permissions on existing key file
             current_mode = os.stat(key_file).st_mode & 0o777
@@ -69,18 +149,35 @@ class ConfigManager:
                 os.close(fd)
             self.cipher = Fernet(key)
 
+        ConfigManager._cipher_cache[key_file] = self.cipher
+
     def _load_yaml(self, file_path: Path) -> dict[str, Any]:
         """Load YAML configuration file"""
-        if not file_path.exists():
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             return {}
 
+        # Unchanged files are served from the parsed tree; callers mutate their copy
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = ConfigManager._yaml_cache.get(file_path)
+        if cached is not None and cached[0] == stamp and cached[1] is not None:
+            return copy.deepcopy(cached[1])
+
         with open(file_path) as f:
-            return yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YamlLoader) or {}
+        # The caller gets the fresh parse. A one-shot CLI process loads each file once,
+        # so only a repeat load of the same file pays for the cache's private copy
+        repeat = cached is not None and cached[0] == stamp
+        ConfigManager._yaml_cache[file_path] = (stamp, copy.deepcopy(data) if repeat else None)
+        return data
 
     def _save_yaml(self, data: dict[str, Any], file_path: Path) -> None:
         """Save configuration to YAML file"""
         with open(file_path, "w") as f:
             yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        # A same-size rewrite within one mtime tick would keep the stale stamp valid
+        ConfigManager._yaml_cache.pop(file_path, None)
 
     def _encrypt_passwords(self) -> None:
         """Encrypt database passwords if not already encrypted"""
@@ -131,19 +228,15 @@ class ConfigManager:
         return cast("dict[str, Any]", self.projects.get("projects", {}))
 
     def get_all_databases(self) -> dict[str, Any]:
-        """Get all database configurations"""
-        databases: dict[str, Any] = {
-            k: v.copy() for k, v in self.databases.get("databases", {}).items()
-        }
-
-        # Decrypt passwords (safe: inner dicts are copies, originals untouched)
-        for _db_name, db_config in databases.items():
-            if "password" in db_config:
-                password = db_config["password"]
-                if password.startswith("enc:"):
-                    db_config["password"] = self.decrypt_value(password)
+        """Get all database configurations
 
-        return databases
+        Each entry is a copy whose password is decrypted lazily on first
+        access, so listing databases does no crypto work.
+        """
+        return {
+            name: _LazyDecryptedConfig(db_config, self.decrypt_value)
+            for name, db_config in self.databases.get("databases", {}).items()
+        }
 
     def get_storage_paths(self) -> dict[str, Path | None]:
         """Get storage paths from settings
@@ -169,10 +262,9 @@ class ConfigManager:
         Returns:
             Setting value or default
         """
-        keys = key.split(".")
         value: Any = self.settings
 
-        for k in keys:
+        for k in _setting_path(key):
             if isinstance(value, dict):
                 value = value.get(k)
                 if value is None:
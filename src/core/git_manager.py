@@ -1,77 +1,129 @@
 """Git Integration Manager for Quartermaster"""
 
 import logging
+import os
 import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from git import InvalidGitRepositoryError, Repo
 
+# Local git queries (log, status, config) should finish in well under this
+_GIT_TIMEOUT = 30
+
+# .gitignore written by init_repo when the project has none
+_DEFAULT_GITIGNORE = (
+    b"# Common ignore patterns\n*.log\n*.tmp\n.env\nnode_modules/\nvendor/\n__pycache__/\n*.pyc\n.DS_Store\nThumbs.db\n"
+)
+
+# Pushes and pulls talk to remote servers
+_GIT_REMOTE_TIMEOUT = 300
+
+# Open Repo objects kept per thread by GitManager._get_repo
+_REPO_CACHE_SIZE = 32
+
+# git log record/field separators; control characters never appear in names or hashes
+_RECORD_SEP = "\x1e"
+_FIELD_SEP = "\x1f"
+_LOG_FORMAT = "%x1e%H%x1f%an%x1f%ae%x1f%ct%x1f%B%x1f"
+
 
 class GitManager:
     """Manages Git operations for projects"""
 
     def __init__(self):
         self.logger = logging.getLogger("GitManager")
+        # GitPython Repo objects are not thread-safe, so each thread keeps its own cache
+        self._local = threading.local()
+        # get_repo_status commit summaries by repo realpath: (HEAD sha, commits, count)
+        self._head_summaries: dict[str, tuple[str, list[dict[str, Any]], int]] = {}
+        # One lock per remote URL so concurrent pushes never hit the same server at once
+        self._remote_locks: dict[str, threading.Lock] = {}
+        # Repos whose safe.directory entry was already written by this process
+        self._safe_dirs: set[str] = set()
+
+    def _get_repo(self, path: str) -> Repo | None:
+        """Return a cached Repo for path, opening it on first use.
+
+        Opening a Repo spawns git to resolve its config; UI flows call several
+        methods on the same path back to back, so repos are kept in a small LRU.
+
+        Args:
+            path: Repository path
+
+        Returns:
+            The Repo, or None if path is not a Git repository
+        """
+        repos: OrderedDict[str, Repo] | None = getattr(self._local, "repos", None)
+        if repos is None:
+            repos = self._local.repos = OrderedDict()
+
+        key = os.path.realpath(path)
+        repo = repos.get(key)
+        if repo is not None:
+            repos.move_to_end(key)
+            return repo
+
+        try:
+            repo = Repo(key)
+        except InvalidGitRepositoryError:
+            return None
+        repos[key] = repo
+        if len(repos) > _REPO_CACHE_SIZE:
+            repos.popitem(last=False)[1].close()
+        return repo
+
+    def _forget_repo(self, path: str) -> None:
+        """Drop a cached Repo so the next call reopens it (e.g. after git init)."""
+        repos: OrderedDict[str, Repo] | None = getattr(self._local, "repos", None)
+        if repos is not None:
+            stale = repos.pop(os.path.realpath(path), None)
+            if stale is not None:
+                stale.close()
 
     def is_git_repo(self, path: str) -> bool:
         """Check if path is a Git repository"""
-        try:
-            Repo(path)
+        # A .git directory (or the .git file of a worktree/submodule) answers with one
+        # stat and no Repo; GitPython is only consulted for bare and other layouts
+        if os.path.exists(os.path.join(path, ".git")):
             return True
-        except InvalidGitRepositoryError:
-            return False
+        return self._get_repo(path) is not None
 
     def get_repo_status(self, path: str) -> dict[str, Any]:
         """Get Git repository status"""
-        if not self.is_git_repo(path):
+        repo = self._get_repo(path)
+        if repo is None:
             return {"is_repo": False, "error": "Not a Git repository"}
 
         try:
-            repo = Repo(path)
+            # Branch, uncommitted and untracked changes from a single git status
+            status = self._git_status(path)
+            changed_files = status["changed_files"]
+            untracked_files = status["untracked_files"]
 
-            # Get current branch
-            try:
-                current_branch = repo.active_branch.name
-            except TypeError:
-                current_branch = "detached HEAD"
+            # Recent commits and the commit count only change when HEAD moves
+            commits, commit_count = self._head_summary(repo, path)
 
-            # Get uncommitted changes
-            changed_files = []
-            if repo.is_dirty():
-                changed_files = [item.a_path for item in repo.index.diff(None)]
-
-            # Get untracked files
-            untracked_files = repo.untracked_files
-
-            # Get recent commits
-            commits = []
-            for commit in list(repo.iter_commits(max_count=10)):
-                commits.append(
-                    {
-                        "hash": commit.hexsha[:7],
-                        "message": commit.message.strip(),
-                        "author": str(commit.author),
-                        "date": datetime.fromtimestamp(commit.committed_date).isoformat(),
-                        "is_savepoint": "savepoint" in commit.message.lower(),
-                    }
-                )
-
-            # Get remotes
+            # Get remotes (URLs from the parsed config; remote.urls spawns git per access)
+            config = repo.config_reader()
             remotes = []
             for remote in repo.remotes:
-                remotes.append({"name": remote.name, "url": next(iter(remote.urls)) if remote.urls else None})
+                urls = config.get_values(f'remote "{remote.name}"', "url", None)
+                remotes.append({"name": remote.name, "url": urls[0] if urls else None})
 
             return {
                 "is_repo": True,
-                "branch": current_branch,
-                "is_dirty": repo.is_dirty(),
+                "branch": status["branch"],
+                "is_dirty": status["is_dirty"],
                 "changed_files": changed_files,
                 "untracked_files": untracked_files,
                 "total_changes": len(changed_files) + len(untracked_files),
                 "commits": commits,
-                "commit_count": int(repo.git.rev_list("--count", "HEAD")),
+                "commit_count": commit_count,
                 "remotes": remotes,
                 "has_remote": len(remotes) > 0,
             }
@@ -80,45 +132,188 @@ class GitManager:
             self.logger.error(f"Failed to get repo status for {path}: {e!s}")
             return {"is_repo": True, "error": "Failed to read repository status"}
 
+    def _head_summary(self, repo: Repo, path: str) -> tuple[list[dict[str, Any]], int]:
+        """Recent commits and total commit count, cached until HEAD moves.
+
+        Status panels poll on a timer; HEAD is read from the ref files without
+        spawning git, so an unchanged repo costs no git log or rev-list.
+
+        Args:
+            repo: Open repository for path
+            path: Repository path
+
+        Returns:
+            Tuple of (last 10 commits, commit count)
+        """
+        head = repo.head.commit.hexsha
+        key = os.path.realpath(path)
+        cached = self._head_summaries.get(key)
+        if cached is not None and cached[0] == head:
+            return [dict(commit) for commit in cached[1]], cached[2]
+
+        commits = [
+            {
+                "hash": entry["hash"][:7],
+                "message": entry["message"],
+                "author": entry["author"],
+                "date": datetime.fromtimestamp(entry["timestamp"]).isoformat(),
+                "is_savepoint": "savepoint" in entry["message"].lower(),
+            }
+            for entry in self._git_log(path, 10)
+        ]
+        commit_count = int(self._run_git(path, "rev-list", "--count", head))
+        self._head_summaries[key] = (head, commits, commit_count)
+        return commits, commit_count
+
+    @staticmethod
+    def _run_git(path: str, *args: str, timeout: int = _GIT_TIMEOUT) -> str:
+        """Run a git command in a repository and return its stdout.
+
+        Raises:
+            subprocess.CalledProcessError: If git exits non-zero (stderr is captured)
+            subprocess.TimeoutExpired: If git runs longer than timeout seconds
+        """
+        result = subprocess.run(
+            ["git", "-C", str(path), *args],
+            capture_output=True,
+            text=True,
+            errors="replace",
+            timeout=timeout,
+            check=True,
+        )
+        return result.stdout
+
+    def _git_status(self, path: str) -> dict[str, Any]:
+        """Read branch and working tree state with one git status call.
+
+        Replaces separate is_dirty / index.diff / untracked_files queries,
+        each of which spawns its own git process.
+
+        Args:
+            path: Repository path
+
+        Returns:
+            Dict with branch ("detached HEAD" when detached), is_dirty (tracked
+            changes, staged or not), changed_files (paths with unstaged changes)
+            and untracked_files
+        """
+        stdout = self._run_git(path, "status", "--porcelain=v2", "--branch", "--untracked-files=all", "-z")
+
+        branch = "detached HEAD"
+        is_dirty = False
+        changed_files: list[str] = []
+        untracked_files: list[str] = []
+        # -z leaves paths unquoted; a rename ("2") entry is followed by its original path
+        entries = iter(stdout.split("\0"))
+        for entry in entries:
+            kind = entry[:1]
+            if entry.startswith("# branch.head "):
+                head = entry[len("# branch.head ") :]
+                if head != "(detached)":
+                    branch = head
+            elif kind in ("1", "2", "u"):
+                is_dirty = True
+                fields = entry.split(" ", {"1": 8, "2": 9, "u": 10}[kind])
+                # Second status letter is the worktree side, matching index.diff(None)
+                if fields[1][1] != ".":
+                    changed_files.append(fields[-1])
+                if kind == "2":
+                    next(entries, None)
+            elif kind == "?":
+                untracked_files.append(entry[2:])
+
+        return {
+            "branch": branch,
+            "is_dirty": is_dirty,
+            "changed_files": changed_files,
+            "untracked_files": untracked_files,
+        }
+
+    def _git_log(self, path: str, limit: int, with_stats: bool = False) -> list[dict[str, Any]]:
+        """Read the most recent commits with a single git log call.
+
+        Per-commit GitPython access parses each object and, for stats, spawns
+        a git diff-tree per commit; one formatted log streams everything at once.
+
+        Args:
+            path: Repository path
+            limit: Maximum number of commits
+            with_stats: Also count the files each commit changed
+
+        Returns:
+            Dicts with hash, author, author_email, timestamp, message and, with
+            stats, files_changed; newest first
+
+        Raises:
+            subprocess.CalledProcessError: If git log fails (e.g. no commits yet)
+        """
+        args = ["log", f"--max-count={limit}", f"--pretty=format:{_LOG_FORMAT}"]
+        if with_stats:
+            # Match commit.stats: renames count as two files, merges diff against the first parent
+            args += ["--numstat", "--no-renames", "--diff-merges=first-parent"]
+
+        entries = []
+        for record in self._run_git(path, *args).split(_RECORD_SEP)[1:]:
+            commit_hash, author, email, committed, message, numstat = record.split(_FIELD_SEP, 5)
+            entry: dict[str, Any] = {
+                "hash": commit_hash,
+                "author": author,
+                "author_email": email,
+                "timestamp": int(committed),
+                "message": message.strip(),
+            }
+            if with_stats:
+                entry["files_changed"] = sum(1 for line in numstat.splitlines() if line.strip())
+            entries.append(entry)
+        return entries
+
     def create_savepoint(self, path: str, message: str | None = None) -> tuple[bool, str]:
         """Create a Git savepoint (commit all changes)"""
-        if not self.is_git_repo(path):
+        repo = self._get_repo(path)
+        if repo is None:
             return False, "Not a Git repository"
 
         try:
-            repo = Repo(path)
-
             # Check if there are changes to commit
-            if not repo.is_dirty() and not repo.untracked_files:
+            status = self._git_status(path)
+            if not status["is_dirty"] and not status["untracked_files"]:
                 return False, "No changes to commit"
 
-            # Configure Git safe directory scoped to this repo (safe from shell injection)
-            try:
-                subprocess.run(
-                    ["git", "config", "--local", "safe.directory", str(path)],
-                    check=False,  # Don't raise exception if already configured
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    cwd=str(path),
-                )
-            except Exception as e:
-                self.logger.warning(f"Failed to configure safe.directory: {e}")
-
-            # Add all changes
-            repo.git.add(A=True)
+            # Configure Git safe directory scoped to this repo (safe from shell injection), once per process
+            if path not in self._safe_dirs:
+                try:
+                    subprocess.run(
+                        ["git", "config", "--local", "safe.directory", str(path)],
+                        check=False,  # Don't raise exception if already configured
+                        capture_output=True,
+                        text=True,
+                        timeout=_GIT_TIMEOUT,
+                        cwd=str(path),
+                    )
+                    self._safe_dirs.add(path)
+                except Exception as e:
+                    self.logger.warning(f"Failed to configure safe.directory: {e}")
 
             # Create commit message
             if not message:
                 message = f"Savepoint - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
 
-            # Commit
-            commit = repo.index.commit(message)
+            # Stage and commit with git itself; GitPython's index.commit re-reads and
+            # rewrites the whole index in Python. pre-commit and commit-msg hooks still
+            # run (as they did under index.commit) and may be slow, so allow the long timeout
+            self._run_git(path, "add", "-A")
+            self._run_git(path, "commit", "--quiet", "-m", message, timeout=_GIT_REMOTE_TIMEOUT)
+            short_hash = repo.head.commit.hexsha[:7]
 
-            self.logger.info(f"Created savepoint for {path}: {commit.hexsha[:7]}")
+            self.logger.info("Created savepoint for %s: %s", path, short_hash)
 
-            return True, f"Savepoint created: {commit.hexsha[:7]} - {message}"
+            return True, f"Savepoint created: {short_hash} - {message}"
 
+        except subprocess.CalledProcessError as e:
+            # A rejecting hook may report on stdout only
+            detail = (e.stderr or "").strip() or (e.stdout or "").strip()
+            self.logger.error("Failed to create savepoint for %s: %s", path, detail)
+            return False, f"Failed to create savepoint: {detail}"
         except Exception as e:
             self.logger.error(f"Failed to create savepoint for {path}: {e!s}")
             return False, f"Failed to create savepoint: {e!s}"
@@ -136,25 +331,20 @@ class GitManager:
             return []
 
         try:
-            repo = Repo(path)
-            commits = []
-
-            for commit in list(repo.iter_commits(max_count=limit)):
-                commits.append(
-                    {
-                        "hash": commit.hexsha,
-                        "short_hash": commit.hexsha[:7],
-                        "message": commit.message.strip(),
-                        "author": str(commit.author),
-                        "author_email": commit.author.email,
-                        "date": datetime.fromtimestamp(commit.committed_date).isoformat(),
-                        "timestamp": commit.committed_date,
-                        "is_savepoint": "savepoint" in commit.message.lower(),
-                        "files_changed": len(commit.stats.files),
-                    }
-                )
-
-            return commits
+            return [
+                {
+                    "hash": entry["hash"],
+                    "short_hash": entry["hash"][:7],
+                    "message": entry["message"],
+                    "author": entry["author"],
+                    "author_email": entry["author_email"],
+                    "date": datetime.fromtimestamp(entry["timestamp"]).isoformat(),
+                    "timestamp": entry["timestamp"],
+                    "is_savepoint": "savepoint" in entry["message"].lower(),
+                    "files_changed": entry["files_changed"],
+                }
+                for entry in self._git_log(path, limit, with_stats=True)
+            ]
 
         except Exception as e:
             self.logger.error(f"Failed to get commit history for {path}: {e!s}")
@@ -166,22 +356,15 @@ class GitManager:
             return False, "Already a Git repository"
 
         try:
+            self._forget_repo(path)
             repo = Repo.init(path)
 
-            # Create initial .gitignore
-            gitignore_path = Path(path) / ".gitignore"
-            if not gitignore_path.exists():
-                with open(gitignore_path, "w") as f:
-                    f.write("# Common ignore patterns\n")
-                    f.write("*.log\n")
-                    f.write("*.tmp\n")
-                    f.write(".env\n")
-                    f.write("node_modules/\n")
-                    f.write("vendor/\n")
-                    f.write("__pycache__/\n")
-                    f.write("*.pyc\n")
-                    f.write(".DS_Store\n")
-                    f.write("Thumbs.db\n")
+            # Create initial .gitignore; exclusive create leaves an existing one untouched
+            try:
+                with open(Path(path) / ".gitignore", "xb") as f:
+                    f.write(_DEFAULT_GITIGNORE)
+            except FileExistsError:
+                self.logger.debug("Keeping existing .gitignore in %s", path)
 
             # Make initial commit
             repo.git.add(A=True)
@@ -196,14 +379,15 @@ class GitManager:
 
     def push_to_remote(self, path: str, remote: str = "origin", branch: str | None = None) -> tuple[bool, str]:
         """Push changes to remote repository"""
-        if not self.is_git_repo(path):
+        repo = self._get_repo(path)
+        if repo is None:
             return False, "Not a Git repository"
 
         try:
-            repo = Repo(path)
-
-            # Check if remote exists
-            if remote not in [r.name for r in repo.remotes]:
+            # Look the remote up directly instead of listing every remote
+            try:
+                url = str(repo.remote(remote).url)
+            except ValueError:
                 return False, f"Remote '{remote}' not found"
 
             # Get current branch if not specified
@@ -213,27 +397,80 @@ class GitManager:
                 except TypeError:
                     return False, "Cannot push from detached HEAD"
 
-            # Push
-            origin = repo.remote(remote)
-            origin.push(branch)
-
-            self.logger.info(f"Pushed {path} to {remote}/{branch}")
-            return True, f"Successfully pushed to {remote}/{branch}"
+            # Push with git directly; GitPython parses the progress stream into objects we discard
+            return self._push_one(path, remote, url, branch)
 
         except Exception as e:
             self.logger.error(f"Failed to push {path}: {e!s}")
             return False, f"Push failed: {e!s}"
 
+    def push_to_all_remotes(self, path: str, branch: str | None = None) -> dict[str, tuple[bool, str]]:
+        """Push a branch to every configured remote concurrently
+
+        Args:
+            path: Repository path
+            branch: Branch to push (default: current branch)
+
+        Returns:
+            Dict mapping remote name to (success, message); empty if not a repo or no remotes
+        """
+        repo = self._get_repo(path)
+        if repo is None:
+            return {}
+
+        config = repo.config_reader()
+        remotes = []
+        for remote in repo.remotes:
+            urls = config.get_values(f'remote "{remote.name}"', "url", None)
+            remotes.append((remote.name, str(urls[0]) if urls else remote.name))
+        if not remotes:
+            return {}
+
+        if not branch:
+            try:
+                branch = repo.active_branch.name
+            except TypeError:
+                return {name: (False, "Cannot push from detached HEAD") for name, _ in remotes}
+
+        # Pushes wait on the network, so total time is the slowest remote rather than the sum
+        with ThreadPoolExecutor(max_workers=len(remotes), thread_name_prefix="gitpush") as pool:
+            futures = {name: pool.submit(self._push_one, path, name, url, branch) for name, url in remotes}
+        return {name: future.result() for name, future in futures.items()}
+
+    def _push_one(self, path: str, remote: str, url: str, branch: str) -> tuple[bool, str]:
+        """Push to one remote, serialized with any other push to the same URL
+
+        Returns:
+            Tuple of (success, message)
+        """
+        with self._remote_locks.setdefault(url, threading.Lock()):
+            try:
+                self._run_git(path, "push", "--porcelain", remote, branch, timeout=_GIT_REMOTE_TIMEOUT)
+            except subprocess.CalledProcessError as e:
+                # --porcelain reports rejected refs as "!<TAB>from:to<TAB>summary" lines on stdout;
+                # transport errors only reach stderr
+                rejected = [line.split("\t")[-1] for line in e.stdout.splitlines() if line.startswith("!")]
+                detail = "; ".join(rejected) or e.stderr.strip()
+                self.logger.error("Failed to push %s to %s: %s", path, remote, detail)
+                return False, f"Push failed: {detail}"
+            except subprocess.TimeoutExpired:
+                self.logger.error("Push of %s to %s timed out", path, remote)
+                return False, f"Push to {remote} timed out after {_GIT_REMOTE_TIMEOUT}s"
+
+        self.logger.info("Pushed %s to %s/%s", path, remote, branch)
+        return True, f"Successfully pushed to {remote}/{branch}"
+
     def pull_from_remote(self, path: str, remote: str = "origin", branch: str | None = None) -> tuple[bool, str]:
         """Pull changes from remote repository"""
-        if not self.is_git_repo(path):
+        repo = self._get_repo(path)
+        if repo is None:
             return False, "Not a Git repository"
 
         try:
-            repo = Repo(path)
-
-            # Check if remote exists
-            if remote not in [r.name for r in repo.remotes]:
+            # Look the remote up directly instead of listing every remote
+            try:
+                repo.remote(remote)
+            except ValueError:
                 return False, f"Remote '{remote}' not found"
 
             # Get current branch if not specified
@@ -243,25 +480,29 @@ class GitManager:
                 except TypeError:
                     return False, "Cannot pull to detached HEAD"
 
-            # Pull
-            origin = repo.remote(remote)
-            origin.pull(branch)
+            # Pull with git directly; GitPython parses the progress stream into objects we discard
+            self._run_git(path, "pull", remote, branch, timeout=_GIT_REMOTE_TIMEOUT)
 
-            self.logger.info(f"Pulled {remote}/{branch} to {path}")
+            self.logger.info("Pulled %s/%s to %s", remote, branch, path)
             return True, f"Successfully pulled from {remote}/{branch}"
 
+        except subprocess.CalledProcessError as e:
+            self.logger.error("Failed to pull to %s: %s", path, e.stderr.strip())
+            return False, f"Pull failed: {e.stderr.strip()}"
+        except subprocess.TimeoutExpired:
+            self.logger.error("Pull of %s from %s timed out", path, remote)
+            return False, f"Pull from {remote} timed out after {_GIT_REMOTE_TIMEOUT}s"
         except Exception as e:
             self.logger.error(f"Failed to pull to {path}: {e!s}")
             return False, f"Pull failed: {e!s}"
 
     def get_diff(self, path: str, commit1: str | None = None, commit2: str | None = None) -> str:
         """Get diff between commits or working directory"""
-        if not self.is_git_repo(path):
+        repo = self._get_repo(path)
+        if repo is None:
             return "Not a Git repository"
 
         try:
-            repo = Repo(path)
-
             if commit1 and commit2:
                 diff = repo.git.diff(commit1, commit2)
             elif commit1:
@@ -283,21 +524,21 @@ class GitManager:
             commit_hash: Commit hash to restore to
             mode: 'hard', 'soft', or 'mixed' (default: 'hard')
         """
-        if not self.is_git_repo(path):
+        repo = self._get_repo(path)
+        if repo is None:
             return False, "Not a Git repository"
 
         try:
-            repo = Repo(path)
-
             # Validate commit exists
             try:
                 repo.commit(commit_hash)
             except Exception as e:
                 return False, f"Commit {commit_hash} not found: {e}"
 
-            # Check if there are uncommitted changes
-            if repo.is_dirty() and mode == "hard":
-                uncommitted_count = len(repo.index.diff(None)) + len(repo.untracked_files)
+            # Check if there are uncommitted changes (one git status instead of three queries)
+            status = self._git_status(path) if mode == "hard" else None
+            if status is not None and status["is_dirty"]:
+                uncommitted_count = len(status["changed_files"]) + len(status["untracked_files"])
                 if uncommitted_count > 0:
                     return False, f"Repository has {uncommitted_count} uncommitted changes. Commit or stash them first."
 
@@ -327,12 +568,11 @@ class GitManager:
             path: Repository path
             commit_hash: Commit hash to revert
         """
-        if not self.is_git_repo(path):
+        repo = self._get_repo(path)
+        if repo is None:
             return False, "Not a Git repository"
 
         try:
-            repo = Repo(path)
-
             # Validate commit exists
             try:
                 repo.commit(commit_hash)
@@ -361,20 +601,19 @@ class GitManager:
             commit_hash: Commit hash to branch from
             branch_name: Name for the new branch
         """
-        if not self.is_git_repo(path):
+        repo = self._get_repo(path)
+        if repo is None:
             return False, "Not a Git repository"
 
         try:
-            repo = Repo(path)
-
             # Validate commit exists
             try:
                 target_commit = repo.commit(commit_hash)
             except Exception as e:
                 return False, f"Commit {commit_hash} not found: {e}"
 
-            # Check if branch already exists
-            if branch_name in [b.name for b in repo.branches]:
+            # Check if branch already exists (lookup by name, no list of names built)
+            if branch_name in repo.heads:
                 return False, f"Branch '{branch_name}' already exists"
 
             # Create new branch from commit
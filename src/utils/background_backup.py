@@ -2,13 +2,16 @@
 
 import json
 import logging
+import os
+import sys
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -27,7 +30,7 @@ class BackupStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupTask:
     """Represents a backup task"""
 
@@ -42,7 +45,14 @@ class BackupTask:
     progress: int = 0  # 0-100
 
 
+# What a task handler reports: final status, result or error message, last-run key to update
+_TaskOutcome = tuple[BackupStatus, str, str | None]
+
 DEFAULT_TASK_MAX_AGE_HOURS = 24
+DEFAULT_MAX_BACKGROUND_TASKS = 2
+
+# A scheduled backup type is overdue once its last run is older than this
+_OVERDUE_THRESHOLD = timedelta(hours=24)
 
 
 class BackgroundBackupManager:
@@ -61,14 +71,40 @@ class BackgroundBackupManager:
 
         # Task tracking
         self.tasks: dict[str, BackupTask] = {}
-        self.active_threads: list[threading.Thread] = []
         self._lock = threading.Lock()
 
+        # Bounded, reused workers; a burst of scheduled tasks queues instead of spawning threads.
+        # Each all-* task already backs up in parallel, so only a couple run at once
+        max_tasks = int(config_manager.get_setting("system.max_background_tasks", DEFAULT_MAX_BACKGROUND_TASKS))
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_tasks), thread_name_prefix="bgbackup")
+        # Futures of queued or running tasks; each removes itself when done
+        self._futures: dict[str, Future[None]] = {}
+
         # Callbacks for UI updates
         self.on_task_update: Callable[[BackupTask], None] | None = None
 
         # Last run tracking
         self.last_run_file = Path(__file__).parent.parent.parent / "config" / ".last_backup_run"
+        # Parsed contents of last_run_file and the mtime they were read at
+        self._last_run: dict[str, str] = {}
+        self._last_run_mtime_ns: int | None = None
+
+    def _load_last_runs(self) -> dict[str, str]:
+        """Return the last-run timestamps, re-reading the file only when it changed on disk
+
+        Returns:
+            Mapping of backup type to ISO timestamp (empty if never run)
+        """
+        try:
+            mtime_ns = os.stat(self.last_run_file).st_mtime_ns
+        except FileNotFoundError:
+            return {}
+
+        if mtime_ns != self._last_run_mtime_ns:
+            with open(self.last_run_file, "rb") as f:
+                self._last_run = json.load(f)
+            self._last_run_mtime_ns = mtime_ns
+        return self._last_run
 
     def _get_last_run_time(self, backup_type: str) -> datetime | None:
         """Get the last time a backup type was run
@@ -79,15 +115,10 @@ class BackgroundBackupManager:
         Returns:
             Last run datetime or None
         """
-        if not self.last_run_file.exists():
-            return None
-
         try:
-            with open(self.last_run_file) as f:
-                data = json.load(f)
-                last_run_str = data.get(backup_type)
-                if last_run_str:
-                    return datetime.fromisoformat(last_run_str)
+            last_run_str = self._load_last_runs().get(backup_type)
+            if last_run_str:
+                return datetime.fromisoformat(last_run_str)
         except Exception as e:
             self.logger.warning(f"Could not read last run time: {e}")
 
@@ -100,18 +131,18 @@ class BackgroundBackupManager:
             backup_type: 'projects' or 'databases'
         """
         try:
-            # Load existing data
-            data = {}
-            if self.last_run_file.exists():
-                with open(self.last_run_file) as f:
-                    data = json.load(f)
+            with self._lock:
+                data = dict(self._load_last_runs())
+                data[backup_type] = datetime.now().isoformat()
 
-            # Update with current time
-            data[backup_type] = datetime.now().isoformat()
+                # Write beside the target and rename, so a crash never leaves a torn file
+                tmp_path = self.last_run_file.with_suffix(".tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                tmp_path.replace(self.last_run_file)
 
-            # Save
-            with open(self.last_run_file, "w") as f:
-                json.dump(data, f, indent=2)
+                self._last_run = data
+                self._last_run_mtime_ns = os.stat(self.last_run_file).st_mtime_ns
 
         except Exception as e:
             self.logger.warning(f"Could not update last run time: {e}")
@@ -123,34 +154,19 @@ class BackgroundBackupManager:
             Dictionary with overdue status and details
         """
         overdue: dict[str, Any] = {"projects": False, "databases": False, "details": []}
-
-        # Check projects
-        last_projects = self._get_last_run_time("projects")
-        if last_projects is None or (datetime.now() - last_projects) > timedelta(hours=24):
-            overdue["projects"] = True
-            overdue["details"].append(
-                {
-                    "type": "projects",
-                    "last_run": last_projects.isoformat() if last_projects else "Never",
-                    "overdue_hours": int((datetime.now() - last_projects).total_seconds() / 3600)
-                    if last_projects
-                    else None,
-                }
-            )
-
-        # Check databases
-        last_databases = self._get_last_run_time("databases")
-        if last_databases is None or (datetime.now() - last_databases) > timedelta(hours=24):
-            overdue["databases"] = True
-            overdue["details"].append(
-                {
-                    "type": "databases",
-                    "last_run": last_databases.isoformat() if last_databases else "Never",
-                    "overdue_hours": int((datetime.now() - last_databases).total_seconds() / 3600)
-                    if last_databases
-                    else None,
-                }
-            )
+        now = datetime.now()
+
+        for backup_type in ("projects", "databases"):
+            last_run = self._get_last_run_time(backup_type)
+            if last_run is None or (now - last_run) > _OVERDUE_THRESHOLD:
+                overdue[backup_type] = True
+                overdue["details"].append(
+                    {
+                        "type": backup_type,
+                        "last_run": last_run.isoformat() if last_run else "Never",
+                        "overdue_hours": int((now - last_run).total_seconds() / 3600) if last_run else None,
+                    }
+                )
 
         return overdue
 
@@ -193,21 +209,44 @@ class BackgroundBackupManager:
         Returns:
             Task ID
         """
+        # Task history repeats a handful of types and targets; share one string object each
+        task_type = sys.intern(task_type)
+        target = sys.intern(target)
         task_id = f"{task_type}_{target}_{int(time.time())}"
 
         with self._lock:
+            # Coalesce with an identical task that is still queued or running
+            for active_id in self._futures:
+                active = self.tasks.get(active_id)
+                if active is not None and active.task_type == task_type and active.target == target:
+                    self.logger.info("Backup task already scheduled: %s", active_id)
+                    return active_id
+
             # Create task
             task = BackupTask(task_id=task_id, task_type=task_type, target=target, status=BackupStatus.PENDING)
             self.tasks[task_id] = task
 
-        # Start background thread
-        thread = threading.Thread(target=self._execute_backup, args=(task_id,), daemon=True)
-        thread.start()
-        self.active_threads.append(thread)
+            # Queue on the worker pool
+            future = self._pool.submit(self._execute_backup, task_id)
+            self._futures[task_id] = future
+        future.add_done_callback(lambda _: self._forget_future(task_id))
 
         self.logger.info(f"Scheduled backup task: {task_id}")
         return task_id
 
+    def _forget_future(self, task_id: str) -> None:
+        """Drop a finished task's future so only queued or running tasks are tracked"""
+        with self._lock:
+            self._futures.pop(task_id, None)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting tasks, drop queued ones, and release the worker pool
+
+        Args:
+            wait: Block until the running backups finish
+        """
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
     def _execute_backup(self, task_id: str) -> None:
         """Execute a backup task in background
 
@@ -226,76 +265,22 @@ class BackgroundBackupManager:
                 task.progress = 10
             self._notify_update(task)
 
-            # Execute backup based on type
-            if task.task_type == "all-projects":
-                task.progress = 30
-                self._notify_update(task)
-                # Skip if today's backup already exists to prevent duplicates on restart
-                results = self.backup_engine.backup_all_projects(parallel=True, skip_if_exists_today=True)
-
-                # Check results
-                success_count = sum(1 for success, _ in results.values() if success)
-                total_count = len(results)
-
-                if success_count == total_count:
-                    task.status = BackupStatus.COMPLETED
-                    task.result_message = f"All {total_count} projects backed up successfully"
-                elif success_count > 0:
-                    task.status = BackupStatus.COMPLETED
-                    task.result_message = f"{success_count}/{total_count} projects backed up successfully"
-                else:
-                    task.status = BackupStatus.FAILED
-                    task.error_message = "All project backups failed"
-
-                # Update last run time
-                self._update_last_run_time("projects")
-
-            elif task.task_type == "all-databases":
-                task.progress = 30
-                self._notify_update(task)
-                # Skip if today's backup already exists to prevent duplicates on restart
-                results = self.backup_engine.backup_all_databases(parallel=True, skip_if_exists_today=True)
-
-                # Check results
-                success_count = sum(1 for success, _ in results.values() if success)
-                total_count = len(results)
-
-                if success_count == total_count:
-                    task.status = BackupStatus.COMPLETED
-                    task.result_message = f"All {total_count} databases backed up successfully"
-                elif success_count > 0:
-                    task.status = BackupStatus.COMPLETED
-                    task.result_message = f"{success_count}/{total_count} databases backed up successfully"
-                else:
-                    task.status = BackupStatus.FAILED
-                    task.error_message = "All database backups failed"
-
-                # Update last run time
-                self._update_last_run_time("databases")
-
-            elif task.task_type == "project":
-                task.progress = 50
-                self._notify_update(task)
-                success, message = self.backup_engine.backup_project(task.target)
-
-                if success:
-                    task.status = BackupStatus.COMPLETED
-                    task.result_message = message
-                else:
-                    task.status = BackupStatus.FAILED
-                    task.error_message = message
-
-            elif task.task_type == "database":
-                task.progress = 50
+            handler = self._HANDLERS.get(task.task_type)
+            if handler is None:
+                status, message, last_run_key = BackupStatus.FAILED, f"Unknown task type: {task.task_type}", None
+            else:
+                progress, run = handler
+                task.progress = progress
                 self._notify_update(task)
-                success, message = self.backup_engine.backup_database(task.target)
+                status, message, last_run_key = run(self, task)
 
-                if success:
-                    task.status = BackupStatus.COMPLETED
-                    task.result_message = message
-                else:
-                    task.status = BackupStatus.FAILED
-                    task.error_message = message
+            task.status = status
+            if status == BackupStatus.FAILED:
+                task.error_message = message
+            else:
+                task.result_message = message
+            if last_run_key:
+                self._update_last_run_time(last_run_key)
 
             # Final update
             task.progress = 100
@@ -310,6 +295,54 @@ class BackgroundBackupManager:
         finally:
             self._notify_update(task)
 
+    @staticmethod
+    def _summarize(results: dict[str, tuple[bool, str]], label: str) -> tuple[BackupStatus, str]:
+        """Turn per-item backup results into a task status and message
+
+        Args:
+            results: Mapping of item name to (success, message)
+            label: Item kind, 'project' or 'database'
+
+        Returns:
+            Tuple of (status, message)
+        """
+        success_count = sum(1 for success, _ in results.values() if success)
+        total_count = len(results)
+
+        if success_count == total_count:
+            return BackupStatus.COMPLETED, f"All {total_count} {label}s backed up successfully"
+        if success_count > 0:
+            return BackupStatus.COMPLETED, f"{success_count}/{total_count} {label}s backed up successfully"
+        return BackupStatus.FAILED, f"All {label} backups failed"
+
+    def _run_all_projects(self, task: BackupTask) -> _TaskOutcome:
+        """Back up every project, skipping those already backed up today (prevents duplicates on restart)"""
+        results = self.backup_engine.backup_all_projects(parallel=True, skip_if_exists_today=True)
+        return (*self._summarize(results, "project"), "projects")
+
+    def _run_all_databases(self, task: BackupTask) -> _TaskOutcome:
+        """Back up every database, skipping those already backed up today (prevents duplicates on restart)"""
+        results = self.backup_engine.backup_all_databases(parallel=True, skip_if_exists_today=True)
+        return (*self._summarize(results, "database"), "databases")
+
+    def _run_project(self, task: BackupTask) -> _TaskOutcome:
+        """Back up the single project named by the task target"""
+        success, message = self.backup_engine.backup_project(task.target)
+        return (BackupStatus.COMPLETED if success else BackupStatus.FAILED), message, None
+
+    def _run_database(self, task: BackupTask) -> _TaskOutcome:
+        """Back up the single database named by the task target"""
+        success, message = self.backup_engine.backup_database(task.target)
+        return (BackupStatus.COMPLETED if success else BackupStatus.FAILED), message, None
+
+    # Task type -> (progress shown while running, handler returning (status, message, last-run key))
+    _HANDLERS: ClassVar[dict[str, tuple[int, "Callable[[BackgroundBackupManager, BackupTask], _TaskOutcome]"]]] = {
+        "all-projects": (30, _run_all_projects),
+        "all-databases": (30, _run_all_databases),
+        "project": (50, _run_project),
+        "database": (50, _run_database),
+    }
+
     def _notify_update(self, task: BackupTask) -> None:
         """Notify callback of task update
 
@@ -347,7 +380,10 @@ class BackgroundBackupManager:
         Returns:
             List of running tasks
         """
-        return [task for task in self.tasks.values() if task.status == BackupStatus.RUNNING]
+        # Only tasks still holding a future can be running; finished history is skipped
+        with self._lock:
+            active = [self.tasks.get(task_id) for task_id in self._futures]
+        return [task for task in active if task is not None and task.status == BackupStatus.RUNNING]
 
     def cleanup_old_tasks(self, max_age_hours: int = DEFAULT_TASK_MAX_AGE_HOURS) -> int:
         """Remove old completed tasks from memory
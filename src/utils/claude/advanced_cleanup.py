@@ -62,13 +62,11 @@ class _AdvancedCleanupMixin:
                 session_count += 1
                 session_bytes = 0
                 session_files = 0
-                for f in sa_dir.rglob("*"):
-                    if not f.is_file():
-                        continue
+                for entry in self._iter_files(sa_dir):
                     try:
-                        st = f.stat()
+                        st = entry.stat(follow_symlinks=False)
                     except OSError as e:
-                        logger.debug("stat failed %s: %s", f, e)
+                        logger.debug("stat failed %s: %s", entry.path, e)
                         continue
                     session_bytes += st.st_size
                     session_files += 1
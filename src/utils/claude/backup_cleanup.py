@@ -3,6 +3,8 @@ Backup cleanup manager — manages cleanup of old backup files on local and sync
 """
 
 import logging
+import os
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -29,37 +31,89 @@ class BackupCleanupManager:
         return self.local_path
 
     @staticmethod
-    def _scan_category(
-        category_dir: Path,
-        pattern: str,
-        now: float,
-        stats: dict[str, Any],
-        category_key: str,
+    def _scan_backup_dir(
+        parent: str,
+        suffix: str,
+        cutoffs: tuple[float, float, float],
+        totals: dict[str, list[int]],
+        section: str,
     ) -> None:
-        """Scan a projects/ or databases/ backup dir and accumulate counts, sizes, and age buckets into `stats`."""
-        if not category_dir.exists():
-            return
-        mb = 1024 * 1024
-        bucket = stats[category_key]
-        for item_dir in category_dir.iterdir():
-            if not item_dir.is_dir():
-                continue
-            bucket["count"] += 1
-            for backup_file in item_dir.glob(pattern):
-                if _is_broken_symlink(backup_file):
-                    continue
-                stat = backup_file.stat()
-                size_mb = stat.st_size / mb
-                age_days = (now - stat.st_mtime) / 86400
+        """Accumulate byte and file counts for `suffix` files directly under `parent` into `totals`.
 
-                bucket["size_mb"] += size_mb
-                bucket["files"] += 1
-                stats["total_size_mb"] += size_mb
+        Each file is stat()ed once. Hidden files (e.g. in-progress temp archives)
+        and broken symlinks are skipped.
 
-                for threshold, key in ((30, "old_30d"), (60, "old_60d"), (90, "old_90d")):
-                    if age_days > threshold:
-                        stats[key]["size_mb"] += size_mb
-                        stats[key]["files"] += 1
+        Raises:
+            OSError: If `parent` cannot be listed
+        """
+        cutoff_30, cutoff_60, cutoff_90 = cutoffs
+        size_sum = files = 0
+        old_30_size = old_30_files = old_60_size = old_60_files = old_90_size = old_90_files = 0
+        with os.scandir(parent) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(".") or not name.endswith(suffix):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                size = st.st_size
+                mtime = st.st_mtime
+                size_sum += size
+                files += 1
+                if mtime < cutoff_30:
+                    old_30_size += size
+                    old_30_files += 1
+                    if mtime < cutoff_60:
+                        old_60_size += size
+                        old_60_files += 1
+                        if mtime < cutoff_90:
+                            old_90_size += size
+                            old_90_files += 1
+
+        for key, size, count in (
+            (section, size_sum, files),
+            ("old_30d", old_30_size, old_30_files),
+            ("old_60d", old_60_size, old_60_files),
+            ("old_90d", old_90_size, old_90_files),
+        ):
+            bucket = totals[key]
+            bucket[0] += size
+            bucket[1] += count
+
+    def _scan_category(
+        self,
+        category_dir: Path,
+        suffix: str,
+        cutoffs: tuple[float, float, float],
+        totals: dict[str, list[int]],
+        section: str,
+    ) -> int:
+        """Scan a projects/ or databases/ backup dir, accumulating into `totals`.
+
+        Returns:
+            Number of per-project/per-database subdirectories found
+        """
+        try:
+            it = os.scandir(category_dir)
+        except FileNotFoundError:
+            return 0
+        except OSError as e:
+            self.logger.warning("Cannot read backup dir %s: %s", category_dir, e)
+            return 0
+        count = 0
+        with it:
+            for item in it:
+                if not item.is_dir():
+                    continue
+                count += 1
+                # Like glob(), an unreadable project/database dir contributes no files
+                try:
+                    self._scan_backup_dir(item.path, suffix, cutoffs, totals, section)
+                except OSError as e:
+                    self.logger.debug("Skipping unreadable backup dir %s: %s", item.path, e)
+        return count
 
     def get_backup_stats(self, location: str = "local") -> dict[str, Any]:
         """
@@ -86,17 +140,26 @@ class BackupCleanupManager:
             return stats
 
         stats["exists"] = True
-        now = datetime.now().timestamp()
-
-        self._scan_category(backup_path / "projects", "*.tar.gz", now, stats, "projects")
-        self._scan_category(backup_path / "databases", "*.sql.gz", now, stats, "databases")
+        now = time.time()
+        cutoffs = (now - 30 * 86400, now - 60 * 86400, now - 90 * 86400)
+
+        # [bytes, files] per section; converted to MB once after the scan
+        sections = ("projects", "databases", "old_30d", "old_60d", "old_90d")
+        totals = {section: [0, 0] for section in sections}
+        stats["projects"]["count"] = self._scan_category(
+            backup_path / "projects", ".tar.gz", cutoffs, totals, "projects"
+        )
+        stats["databases"]["count"] = self._scan_category(
+            backup_path / "databases", ".sql.gz", cutoffs, totals, "databases"
+        )
 
-        # Round all values
-        for key in ["total_size_mb"]:
-            stats[key] = round(stats[key], 2)
-        for section in ["projects", "databases", "old_30d", "old_60d", "old_90d"]:
-            if "size_mb" in stats[section]:
-                stats[section]["size_mb"] = round(stats[section]["size_mb"], 2)
+        mb = 1024 * 1024
+        for section in sections:
+            size_bytes, files = totals[section]
+            stats[section]["size_mb"] = round(size_bytes / mb, 2)
+            stats[section]["files"] = files
+        total_bytes = totals["projects"][0] + totals["databases"][0]
+        stats["total_size_mb"] = round(total_bytes / mb, 2)
 
         return stats
 
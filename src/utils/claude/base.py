@@ -2,9 +2,12 @@
 Claude Config Manager — base class with shared state, caching, and directory helpers.
 """
 
+import json
 import logging
+import os
 import re
-import shutil
+import time
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -19,10 +22,14 @@ class _ClaudeConfigBase:
     PROTECTED_DIRS = frozenset({"memory"})
 
     # UUID pattern for session directories
-    UUID_PATTERN = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+    # Use with fullmatch(); ASCII-only classes, no anchors needed
+    UUID_PATTERN = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.ASCII)
 
     DEFAULT_CACHE_TTL = 300  # 5 minutes
 
+    # Directory size cache persisted under export_base_path between runs
+    SIZE_CACHE_FILENAME = ".size_cache.json"
+
     # Health status thresholds (MB)
     HEALTH_GOOD_MB = 100
     HEALTH_WARNING_MB = 300
@@ -73,12 +80,35 @@ class _ClaudeConfigBase:
         # All projects dirs across all managed .claude directories
         self.all_projects_dirs = [d / "projects" for d in self.claude_dirs if (d / "projects").is_dir()]
 
+        # Created on first write (see _ensure_export_dir), not for read-only use
         self.export_base_path = export_base_path or Path.home() / "backups" / "claude_exports"
-        self.export_base_path.mkdir(parents=True, exist_ok=True)
+        self._export_dir_ready = False
 
-        # Cache for directory sizes (path -> (size, timestamp))
-        self._size_cache: dict[str, tuple[int, float]] = {}
+        # Cache for directory sizes (path -> (size, timestamp, dir mtime_ns at walk time)).
+        # Persisted across processes; entries still expire after cache_ttl
+        self._size_cache: dict[str, tuple[int, float, int]] = {}
         self._cache_ttl = cache_ttl
+        self._size_cache_path = self.export_base_path / self.SIZE_CACHE_FILENAME
+        self._size_cache_dirty = False
+        self._load_size_cache()
+
+        # Resolved project cache names (encoded name -> original path)
+        self._decoded_names: dict[str, str] = {}
+
+        # Parsed mcp.json keyed by its (mtime_ns, size)
+        self._mcp_cache: tuple[tuple[int, int], dict] | None = None
+
+    @classmethod
+    def _is_uuid_name(cls, name: str) -> bool:
+        """Check for a session UUID, rejecting most non-matches before the regex runs"""
+        return (
+            len(name) == 36
+            and name[8] == "-"
+            and name[13] == "-"
+            and name[18] == "-"
+            and name[23] == "-"
+            and cls.UUID_PATTERN.fullmatch(name) is not None
+        )
 
     @staticmethod
     def _auto_detect_claude_dirs() -> list[Path]:
@@ -91,6 +121,74 @@ class _ClaudeConfigBase:
             home_claude = Path.home() / ".claude"
             return [home_claude] if home_claude.is_dir() else []
 
+    def _load_size_cache(self) -> None:
+        """
+        Seed the size cache from the previous process's cache file
+
+        An entry is kept only if it is younger than cache_ttl and its directory's
+        mtime_ns still matches. Directory mtime only reflects direct children being
+        added or removed, so the TTL remains the bound on staleness, as in-process.
+        """
+        try:
+            with open(self._size_cache_path, "rb") as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable size cache %s: %s", self._size_cache_path, e)
+            return
+
+        now = time.time()
+        loaded: dict[str, tuple[int, float, int]] = {}
+        try:
+            for key, (size, cached_time, mtime_ns) in saved.items():
+                path = key.partition("\0")[0]
+                if now - cached_time >= self._cache_ttl or self._dir_mtime_ns(path) != mtime_ns:
+                    continue
+                loaded[key] = (int(size), cached_time, mtime_ns)
+        except (TypeError, ValueError, AttributeError) as e:
+            # Valid JSON of the wrong shape (truncated or hand-edited): discard the file
+            logger.debug("Discarding malformed size cache %s: %s", self._size_cache_path, e)
+            self._size_cache_path.unlink(missing_ok=True)
+            return
+        self._size_cache.update(loaded)
+
+    def _save_size_cache(self) -> None:
+        """Write unexpired size cache entries to disk atomically, if anything changed"""
+        if not self._size_cache_dirty:
+            return
+        self._size_cache_dirty = False
+        now = time.time()
+        live = {path: entry for path, entry in self._size_cache.items() if now - entry[1] < self._cache_ttl}
+        tmp_path = self._size_cache_path.with_suffix(".tmp")
+        try:
+            self._ensure_export_dir()
+            tmp_path.write_text(json.dumps(live, separators=(",", ":")))
+            tmp_path.replace(self._size_cache_path)
+        except OSError as e:
+            logger.debug("Could not save size cache to %s: %s", self._size_cache_path, e)
+
+    def _ensure_export_dir(self) -> None:
+        """Create export_base_path on first use"""
+        if not self._export_dir_ready:
+            self.export_base_path.mkdir(parents=True, exist_ok=True)
+            self._export_dir_ready = True
+
+    @staticmethod
+    def _size_cache_key(directory: Path | str, exclude_dirs: frozenset[str] = frozenset()) -> str:
+        """Cache key for a directory size, distinguishing sizes taken with excluded subtrees"""
+        if not exclude_dirs:
+            return str(directory)
+        return f"{directory}\0{','.join(sorted(exclude_dirs))}"
+
+    @staticmethod
+    def _dir_mtime_ns(path: Path | str) -> int:
+        """mtime_ns of path, or -1 if it cannot be stat'ed"""
+        try:
+            return Path(path).stat().st_mtime_ns
+        except OSError:
+            return -1
+
     def invalidate_cache(self, directory: Path | None = None) -> None:
         """
         Invalidate size cache for a specific directory or all directories
@@ -100,59 +198,219 @@ class _ClaudeConfigBase:
         """
         if directory:
             cache_key = str(directory)
-            if cache_key in self._size_cache:
-                del self._size_cache[cache_key]
+            # Also drop sizes of this directory taken with excluded subtrees
+            stale = [k for k in self._size_cache if k == cache_key or k.startswith(cache_key + "\0")]
+            for key in stale:
+                del self._size_cache[key]
+            if stale:
                 logger.debug("Invalidated cache for %s", directory)
         else:
             self._size_cache.clear()
             logger.debug("Cleared entire size cache")
+        self._size_cache_dirty = True
+        self._save_size_cache()
 
-    def get_directory_size(self, directory: Path, use_cache: bool = True) -> int:
+    def get_directory_size(
+        self, directory: Path, use_cache: bool = True, exclude_dirs: frozenset[str] = frozenset()
+    ) -> int:
         """
         Calculate total size of a directory recursively (with caching)
 
         Args:
             directory: Path to directory
             use_cache: Whether to use cached values (default: True)
+            exclude_dirs: Subdirectory names to leave out, at any depth; they are not walked
 
         Returns:
             Size in bytes
         """
-        import time
-
-        cache_key = str(directory)
+        cache_key = self._size_cache_key(directory, exclude_dirs)
 
         # Check cache if enabled
-        if use_cache and cache_key in self._size_cache:
-            cached_size, cached_time = self._size_cache[cache_key]
-            age = time.time() - cached_time
-
-            if age < self._cache_ttl:
-                logger.debug("Using cached size for %s (age: %.1fs)", directory, age)
+        if use_cache:
+            cached_size = self._cached_size(directory, exclude_dirs)
+            if cached_size is not None:
                 return cached_size
-            else:
-                logger.debug("Cache expired for %s (age: %.1fs)", directory, age)
 
         # Calculate size
         total = 0
+        mtime_ns = self._dir_mtime_ns(directory)
         try:
-            for item in directory.rglob("*"):
-                if item.is_symlink() or not item.is_file():
-                    continue
-                try:
-                    total += item.stat().st_size
-                except (OSError, PermissionError):
-                    continue
-        except (OSError, PermissionError) as e:
+            total = self._scandir_size(directory, exclude_dirs)
+        except FileNotFoundError:
+            logger.debug("Directory %s does not exist", directory)
+        except OSError as e:
             logger.warning("Permission error accessing %s: %s", directory, e)
 
         # Update cache
         if use_cache:
-            self._size_cache[cache_key] = (total, time.time())
+            self._size_cache[cache_key] = (total, time.time(), mtime_ns)
+            self._size_cache_dirty = True
             logger.debug("Cached size for %s: %.2f MB", directory, total / (1024 * 1024))
 
         return total
 
+    def _cached_size(self, directory: Path, exclude_dirs: frozenset[str] = frozenset()) -> int | None:
+        """Return the cached size of directory, or None if absent or expired"""
+        cached = self._size_cache.get(self._size_cache_key(directory, exclude_dirs))
+        if cached is None:
+            return None
+        cached_size, cached_time, _mtime_ns = cached
+        age = time.time() - cached_time
+        if age < self._cache_ttl:
+            logger.debug("Using cached size for %s (age: %.1fs)", directory, age)
+            return cached_size
+        logger.debug("Cache expired for %s (age: %.1fs)", directory, age)
+        return None
+
+    def _walk_sizes(
+        self, root: Path, child_depth: int = 1, exclude_dirs: frozenset[str] = frozenset()
+    ) -> tuple[int, dict[str, int]]:
+        """
+        Size root in one scandir walk, also recording the subtree size of every
+        directory up to child_depth levels below it
+
+        All recorded sizes, including root's, are stored in the size cache so later
+        get_directory_size calls on those directories skip the walk. With exclude_dirs,
+        each recorded directory is also cached as get_directory_size(..., exclude_dirs)
+        would measure it, from the same walk.
+
+        Args:
+            root: Directory to walk
+            child_depth: How many levels of subdirectories to record (1 = immediate children)
+            exclude_dirs: Subdirectory names to also cache excluded sizes for
+
+        Returns:
+            Tuple of (total bytes under root, {subdirectory path: subtree bytes})
+        """
+        sizes: dict[str, int] = {}
+        kept_sizes: dict[str, int] = {}
+        mtimes: dict[str, int] = {}
+
+        def walk(path: str, depth: int) -> tuple[int, int]:
+            # Returns (all bytes, bytes outside exclude_dirs subtrees)
+            total = kept = 0
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            size = entry.stat(follow_symlinks=False).st_size
+                            total += size
+                            kept += size
+                        elif entry.is_dir(follow_symlinks=False):
+                            record = depth < child_depth
+                            if record:
+                                mtimes[entry.path] = entry.stat(follow_symlinks=False).st_mtime_ns
+                            if entry.name in exclude_dirs:
+                                sub_total, sub_kept = self._scandir_size(entry.path), 0
+                            else:
+                                sub_total, sub_kept = walk(entry.path, depth + 1)
+                            if record:
+                                sizes[entry.path] = sub_total
+                                kept_sizes[entry.path] = sub_kept
+                            total += sub_total
+                            kept += sub_kept
+                    except OSError:
+                        continue
+            return total, kept
+
+        total = kept = 0
+        root_mtime_ns = self._dir_mtime_ns(root)
+        try:
+            total, kept = walk(str(root), 0)
+        except FileNotFoundError:
+            logger.debug("Directory %s does not exist", root)
+        except OSError as e:
+            logger.warning("Permission error accessing %s: %s", root, e)
+
+        now = time.time()
+        for path, size in sizes.items():
+            self._size_cache[path] = (size, now, mtimes[path])
+            if exclude_dirs:
+                self._size_cache[self._size_cache_key(path, exclude_dirs)] = (kept_sizes[path], now, mtimes[path])
+        self._size_cache[str(root)] = (total, now, root_mtime_ns)
+        if exclude_dirs:
+            self._size_cache[self._size_cache_key(root, exclude_dirs)] = (kept, now, root_mtime_ns)
+        self._size_cache_dirty = True
+
+        return total, sizes
+
+    @staticmethod
+    def _scandir_size(path: Path | str, exclude_dirs: frozenset[str] = frozenset()) -> int:
+        """
+        Sum file sizes under path, reusing the stat info cached on each DirEntry
+
+        Symlinks are not followed, and subdirectories named in exclude_dirs are pruned
+        without being walked. Unreadable subdirectories and entries are skipped;
+        an error opening path itself propagates to the caller.
+        """
+        total = 0
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                    elif entry.is_dir(follow_symlinks=False) and entry.name not in exclude_dirs:
+                        total += _ClaudeConfigBase._scandir_size(entry.path, exclude_dirs)
+                except OSError:
+                    continue
+        return total
+
+    @staticmethod
+    def _iter_files(path: Path | str) -> Iterator[os.DirEntry[str]]:
+        """
+        Yield a DirEntry for every regular file under path, without following symlinks
+
+        The entries carry the stat info readdir already returned, so callers get the
+        file type for free and one stat per file at most. Unreadable subdirectories are
+        skipped; an error opening path itself propagates.
+
+        Walks with an explicit stack: nested generators would cost every yielded entry
+        one resume per directory level.
+        """
+        root = os.fspath(path)
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            try:
+                it = os.scandir(current)
+            except OSError:
+                if current is root:
+                    raise
+                continue
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            yield entry
+                        elif entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        continue
+
+    @staticmethod
+    def _rmtree_with_size(path: Path | str) -> int:
+        """
+        Delete a directory tree in one scandir walk, returning the bytes of regular files removed
+
+        Replaces a get_directory_size() walk followed by shutil.rmtree(), which would list
+        the same tree twice. Like rmtree, refuses to operate on a symlink and raises OSError
+        on the first entry it cannot remove.
+        """
+        if os.path.islink(path):
+            raise OSError(f"Cannot call rmtree on a symbolic link: {path}")
+        total = 0
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    total += _ClaudeConfigBase._rmtree_with_size(entry.path)
+                else:
+                    if entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                    os.unlink(entry.path)
+        Path(path).rmdir()
+        return total
+
     # --- Generic Directory Helpers ---
 
     def _get_simple_dir_stats(self, dir_path: Path, age_threshold_days: int = 30) -> dict[str, Any]:
@@ -174,11 +432,9 @@ class _ClaudeConfigBase:
         cutoff = now - (age_threshold_days * 24 * 3600)
 
         try:
-            for file_path in dir_path.rglob("*"):
-                if file_path.is_symlink() or not file_path.is_file():
-                    continue
+            for entry in self._iter_files(dir_path):
                 file_count += 1
-                st = file_path.stat()
+                st = entry.stat(follow_symlinks=False)
                 size = st.st_size
                 total_size += size
                 if st.st_mtime < cutoff:
@@ -207,8 +463,7 @@ class _ClaudeConfigBase:
 
         try:
             if max_age_days is None:
-                size_freed = self.get_directory_size(dir_path)
-                shutil.rmtree(dir_path)
+                size_freed = self._rmtree_with_size(dir_path)
                 dir_path.mkdir(parents=True, exist_ok=True)
                 self.invalidate_cache()
                 return (
@@ -217,15 +472,13 @@ class _ClaudeConfigBase:
                     {"deleted": "all", "size_freed_mb": round(size_freed / (1024 * 1024), 2)},
                 )
             else:
-                cutoff_time = datetime.now().timestamp() - (max_age_days * 24 * 3600)
-                for file_path in dir_path.rglob("*"):
-                    if file_path.is_symlink() or not file_path.is_file():
-                        continue
+                cutoff_time = time.time() - max_age_days * 86400
+                for entry in self._iter_files(dir_path):
                     try:
-                        stat = file_path.stat()
+                        stat = entry.stat(follow_symlinks=False)
                         if stat.st_mtime < cutoff_time:
                             size_freed += stat.st_size
-                            file_path.unlink()
+                            os.unlink(entry.path)
                             deleted_count += 1
                     except (FileNotFoundError, OSError):
                         continue
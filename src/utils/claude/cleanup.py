@@ -3,6 +3,7 @@ Claude Config Manager — cleanup operations (dead projects, dirs, history, plug
 """
 
 import logging
+import mmap
 import os
 import shutil
 from collections.abc import Callable
@@ -12,15 +13,55 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+_READ_CHUNK = 1 << 20
+
+
+def _count_lines(path: Path) -> tuple[int, int]:
+    """
+    Count lines in a file without decoding it.
+
+    Returns:
+        (size_bytes, line_count), counting a final unterminated line as a line
+    """
+    count = 0
+    last = b"\n"
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        while chunk := f.read(_READ_CHUNK):
+            count += chunk.count(b"\n")
+            last = chunk[-1:]
+    return size, count + (last != b"\n")
+
+
+def _tail_offset(mm: mmap.mmap, keep_last_n: int) -> int | None:
+    """
+    Find the byte offset where the last `keep_last_n` lines of `mm` start.
+
+    Returns:
+        The offset, or None if the buffer holds no more than `keep_last_n` lines
+    """
+    end = len(mm)
+    if mm[end - 1 : end] == b"\n":
+        end -= 1
+    for _ in range(keep_last_n):
+        end = mm.rfind(b"\n", 0, end)
+        if end == -1:
+            return None
+    return end + 1
+
 
 class _CleanupMixin:
     """Cleanup and maintenance operations. Requires _ClaudeConfigBase attributes."""
 
-    def preview_dead_projects(self) -> list[dict]:
+    def preview_dead_projects(self, with_sizes: bool = True) -> list[dict]:
         """
         Preview which project caches would be removed (without deleting).
         Scans all managed .claude directories.
 
+        Args:
+            with_sizes: Size each dead project (default: True). Cleanup passes False
+                since deleting measures the bytes anyway.
+
         Returns:
             List of projects that would be removed with details
         """
@@ -28,16 +69,21 @@ class _CleanupMixin:
 
         for projects_dir in self.all_projects_dirs:
             try:
-                for project_dir in projects_dir.iterdir():
-                    if not project_dir.is_dir():
+                with os.scandir(projects_dir) as it:
+                    entries = list(it)
+                for entry in entries:
+                    # d_type from readdir answers this without a stat
+                    if not entry.is_dir(follow_symlinks=False):
                         continue
 
-                    cache_name = project_dir.name
+                    project_dir = Path(entry.path)
+                    cache_name = entry.name
                     original_path = cache_name.replace("-", "/")
-                    path_exists = Path(original_path).exists()
+                    # One lstat, no exception on a missing path
+                    path_exists = os.path.lexists(original_path)
 
                     if not path_exists:
-                        size = self.get_directory_size(project_dir)
+                        size = self.get_directory_size(project_dir) if with_sizes else 0
 
                         dead_projects.append(
                             {
@@ -73,16 +119,15 @@ class _CleanupMixin:
         removed_projects = []
 
         try:
-            dead_projects = self.preview_dead_projects()
+            dead_projects = self.preview_dead_projects(with_sizes=False)
 
             if confirmed_projects:
                 dead_projects = [p for p in dead_projects if p["cache_name"] in confirmed_projects]
 
             for project in dead_projects:
-                project_dir = Path(project["cache_path"])
-                shutil.rmtree(project_dir)
+                # Sizes what is actually deleted, even if it changed since the preview
+                size_freed += self._rmtree_with_size(project["cache_path"])
                 removed_count += 1
-                size_freed += project.get("size_bytes", 0)
                 removed_projects.append({"name": project["cache_name"], "reason": project["reason"]})
                 logger.info("Removed dead project cache: %s", project["cache_name"])
 
@@ -161,10 +206,9 @@ class _CleanupMixin:
                 continue
             found = True
             try:
-                total_size += history_file.stat().st_size
-                with open(history_file, encoding="utf-8", errors="ignore") as f:
-                    for _ in f:
-                        total_lines += 1
+                size, lines = _count_lines(history_file)
+                total_size += size
+                total_lines += lines
             except (OSError, PermissionError) as e:
                 logger.warning("Error reading history in %s: %s", claude_d, e)
 
@@ -192,22 +236,22 @@ class _CleanupMixin:
                     history_file.unlink()
                     total_freed += original_size / (1024 * 1024)
                     total_deleted += 1
-                else:
-                    with open(history_file, encoding="utf-8", errors="ignore") as f:
-                        lines = f.readlines()
-
-                    if len(lines) <= keep_last_n:
-                        continue
-
-                    kept_lines = lines[-keep_last_n:]
+                elif original_size:
                     tmp_path = history_file.with_suffix(".tmp")
-                    with open(tmp_path, "w", encoding="utf-8") as f:
-                        f.writelines(kept_lines)
-                    os.replace(tmp_path, history_file)
-
-                    new_size = history_file.stat().st_size
-                    total_freed += (original_size - new_size) / (1024 * 1024)
-                    total_deleted += len(lines) - keep_last_n
+                    with open(history_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        cut = _tail_offset(mm, keep_last_n)
+                        if cut is None:
+                            continue
+                        dropped = 0
+                        for start in range(0, cut, _READ_CHUNK):
+                            dropped += mm[start : min(start + _READ_CHUNK, cut)].count(b"\n")
+                        with open(tmp_path, "wb") as out:
+                            for start in range(cut, len(mm), _READ_CHUNK):
+                                out.write(mm[start : start + _READ_CHUNK])
+                    tmp_path.replace(history_file)
+
+                    total_freed += cut / (1024 * 1024)
+                    total_deleted += dropped
 
             except Exception as e:
                 logger.error("Error cleaning history in %s: %s", claude_d, e)
@@ -231,10 +275,9 @@ class _CleanupMixin:
                 continue
             found = True
             try:
-                for file_path in cache_dir.rglob("*"):
-                    if file_path.is_file():
-                        file_count += 1
-                        total_size += file_path.stat().st_size
+                for entry in self._iter_files(cache_dir):
+                    file_count += 1
+                    total_size += entry.stat(follow_symlinks=False).st_size
             except (OSError, PermissionError) as e:
                 logger.warning("Error reading plugins cache in %s: %s", claude_d, e)
 
@@ -249,8 +292,7 @@ class _CleanupMixin:
             if not cache_dir.exists():
                 continue
             try:
-                size_freed = self.get_directory_size(cache_dir)
-                shutil.rmtree(cache_dir)
+                size_freed = self._rmtree_with_size(cache_dir)
                 cache_dir.mkdir(parents=True, exist_ok=True)
                 total_freed += size_freed / (1024 * 1024)
             except Exception as e:
@@ -281,29 +323,22 @@ class _CleanupMixin:
         total_size = 0
 
         try:
-            for item in versions_dir.iterdir():
-                if item.is_dir():
-                    size = self.get_directory_size(item)
-                    total_size += size
-                    versions.append(
-                        {
-                            "name": item.name,
-                            "path": str(item),
-                            "size_bytes": size,
-                            "size_mb": round(size / (1024 * 1024), 2),
-                            "mtime": item.stat().st_mtime,
-                        }
-                    )
-                elif item.is_file():
-                    size = item.stat().st_size
+            with os.scandir(versions_dir) as it:
+                for entry in it:
+                    is_dir = entry.is_dir()
+                    if not is_dir and not entry.is_file():
+                        continue
+                    st = entry.stat()
+                    size = self.get_directory_size(Path(entry.path)) if is_dir else st.st_size
                     total_size += size
                     versions.append(
                         {
-                            "name": item.name,
-                            "path": str(item),
+                            "name": entry.name,
+                            "path": entry.path,
+                            "is_dir": is_dir,
                             "size_bytes": size,
                             "size_mb": round(size / (1024 * 1024), 2),
-                            "mtime": item.stat().st_mtime,
+                            "mtime": st.st_mtime,
                         }
                     )
         except (OSError, PermissionError) as e:
@@ -347,7 +382,7 @@ class _CleanupMixin:
                 size_freed += version["size_bytes"]
 
                 try:
-                    if path.is_dir():
+                    if version["is_dir"]:
                         shutil.rmtree(path)
                     else:
                         path.unlink()
@@ -2,9 +2,11 @@
 Claude Config Manager — conversation history management.
 """
 
+import heapq
 import logging
-import shutil
-from datetime import datetime
+import os
+import time
+from operator import itemgetter
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -29,20 +31,23 @@ class _ConversationsMixin:
             if not source.exists():
                 return False, f"Project not found: {project_path}", {}
 
-            # Get all .jsonl files (conversation files)
-            conversation_files = sorted(source.glob("*.jsonl"), key=lambda x: x.stat().st_mtime, reverse=True)
-
-            # Get all UUID directories (conversation data directories)
+            # One scandir pass collects (mtime, path, size) for .jsonl conversation files
+            # and UUID conversation data directories, reusing each entry's cached stat.
             # Skip protected dirs (e.g. memory/) that Claude Code uses for persistent data
-            conversation_dirs = sorted(
-                [
-                    d
-                    for d in source.iterdir()
-                    if d.is_dir() and d.name not in self.PROTECTED_DIRS and self.UUID_PATTERN.match(d.name)
-                ],
-                key=lambda x: x.stat().st_mtime,
-                reverse=True,
-            )
+            conversation_files: list[tuple[float, str, int]] = []
+            conversation_dirs: list[tuple[float, str, int]] = []
+            with os.scandir(source) as it:
+                for entry in it:
+                    if entry.name.endswith(".jsonl") and entry.is_file():
+                        st = entry.stat()
+                        conversation_files.append((st.st_mtime, entry.path, st.st_size))
+                    elif (
+                        entry.is_dir(follow_symlinks=False)
+                        and entry.name not in self.PROTECTED_DIRS
+                        and self._is_uuid_name(entry.name)
+                    ):
+                        st = entry.stat(follow_symlinks=False)
+                        conversation_dirs.append((st.st_mtime, entry.path, st.st_size))
 
             total_files = len(conversation_files)
             total_dirs = len(conversation_dirs)
@@ -51,20 +56,24 @@ class _ConversationsMixin:
             deleted_files = 0
             deleted_dirs = 0
 
-            # Delete old .jsonl files
+            # Delete old .jsonl files: everything except the keep_count newest.
+            # nlargest is O(N log k), and keep_count is usually tiny
             if total_files > keep_count:
-                files_to_delete = conversation_files[keep_count:]
-                for file_path in files_to_delete:
-                    size_freed += file_path.stat().st_size
-                    file_path.unlink()
+                survivors = {p for _, p, _ in heapq.nlargest(keep_count, conversation_files, key=itemgetter(0))}
+                for _mtime, file_path, size in conversation_files:
+                    if file_path in survivors:
+                        continue
+                    os.unlink(file_path)
+                    size_freed += size
                     deleted_files += 1
 
             # Delete old UUID directories
             if total_dirs > keep_count:
-                dirs_to_delete = conversation_dirs[keep_count:]
-                for dir_path in dirs_to_delete:
-                    size_freed += self.get_directory_size(dir_path)
-                    shutil.rmtree(dir_path)
+                survivors = {p for _, p, _ in heapq.nlargest(keep_count, conversation_dirs, key=itemgetter(0))}
+                for _mtime, dir_path, _size in conversation_dirs:
+                    if dir_path in survivors:
+                        continue
+                    size_freed += self._rmtree_with_size(dir_path)
                     deleted_dirs += 1
 
             if deleted_files == 0 and deleted_dirs == 0:
@@ -134,7 +143,9 @@ class _ConversationsMixin:
             },
         )
 
-    def clean_old_conversations(self, project_path: str, max_age_days: int = 7) -> tuple[bool, str, dict]:
+    def clean_old_conversations(
+        self, project_path: str, max_age_days: int = 7, now_ns: int | None = None
+    ) -> tuple[bool, str, dict]:
         """
         Delete conversations older than max_age_days in a project (age-based cleanup).
         Complements keep_last_n_conversations which is count-based.
@@ -142,6 +153,7 @@ class _ConversationsMixin:
         Args:
             project_path: Full path to project directory
             max_age_days: Delete conversations older than this many days
+            now_ns: Reference time in epoch nanoseconds for the age cutoff (default: current time)
 
         Returns:
             Tuple of (success, message, details_dict)
@@ -151,31 +163,32 @@ class _ConversationsMixin:
             if not source.exists():
                 return False, f"Project not found: {project_path}", {}
 
-            now = datetime.now().timestamp()
-            cutoff_time = now - (max_age_days * 86400)
+            if now_ns is None:
+                now_ns = time.time_ns()
+            cutoff_ns = now_ns - max_age_days * 86400 * 1_000_000_000
 
             size_freed = 0
             deleted_files = 0
             deleted_dirs = 0
 
-            # Delete old .jsonl files
-            for jsonl_file in source.glob("*.jsonl"):
-                if jsonl_file.stat().st_mtime < cutoff_time:
-                    size_freed += jsonl_file.stat().st_size
-                    jsonl_file.unlink()
-                    deleted_files += 1
-
-            # Delete old UUID session directories (skip protected dirs like memory/)
-            for subdir in source.iterdir():
-                if not subdir.is_dir():
-                    continue
-                if subdir.name in self.PROTECTED_DIRS:
-                    continue
-                if not self.UUID_PATTERN.match(subdir.name):
-                    continue
-                if subdir.stat().st_mtime < cutoff_time:
-                    size_freed += self.get_directory_size(subdir)
-                    shutil.rmtree(subdir)
+            # One scandir pass: old .jsonl files and old UUID session directories
+            # (skip protected dirs like memory/), each judged from a single stat
+            with os.scandir(source) as it:
+                entries = list(it)
+            for entry in entries:
+                if entry.name.endswith(".jsonl") and entry.is_file():
+                    st = entry.stat()
+                    if st.st_mtime_ns < cutoff_ns:
+                        os.unlink(entry.path)
+                        size_freed += st.st_size
+                        deleted_files += 1
+                elif (
+                    entry.is_dir(follow_symlinks=False)
+                    and entry.name not in self.PROTECTED_DIRS
+                    and self._is_uuid_name(entry.name)
+                    and entry.stat(follow_symlinks=False).st_mtime_ns < cutoff_ns
+                ):
+                    size_freed += self._rmtree_with_size(entry.path)
                     deleted_dirs += 1
 
             if deleted_files == 0 and deleted_dirs == 0:
@@ -217,9 +230,10 @@ class _ConversationsMixin:
         total_deleted = 0
         total_size_freed = 0
         projects_cleaned = 0
+        now_ns = time.time_ns()
 
         for project in projects:
-            success, _message, details = self.clean_old_conversations(project["path"], max_age_days)
+            success, _message, details = self.clean_old_conversations(project["path"], max_age_days, now_ns=now_ns)
 
             if success and details.get("deleted", 0) > 0:
                 projects_cleaned += 1
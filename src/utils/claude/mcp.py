@@ -7,6 +7,7 @@ import logging
 import os
 import shutil
 import tempfile
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
@@ -14,40 +15,69 @@ logger = logging.getLogger(__name__)
 class _MCPMixin:
     """MCP server CRUD operations. Requires _ClaudeConfigBase attributes."""
 
-    def get_mcp_servers(self) -> tuple[bool, list[dict], str]:
+    mcp_config_path: Path
+    _mcp_cache: tuple[tuple[int, int], dict] | None
+
+    def _load_mcp_config(self) -> dict:
         """
-        Get list of configured MCP servers
+        Parse mcp.json, reusing the last parse while the file's mtime and size are unchanged
 
-        Returns:
-            Tuple of (success, servers_list, error_message)
+        The returned dict is shared with the cache and must not be mutated.
+
+        Raises:
+            FileNotFoundError: If mcp.json does not exist
+            json.JSONDecodeError: If mcp.json is not valid JSON
         """
-        if not self.mcp_config_path.exists():
-            return True, [], ""
+        st = self.mcp_config_path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._mcp_cache is not None and self._mcp_cache[0] == stamp:
+            return self._mcp_cache[1]
 
-        try:
-            with open(self.mcp_config_path) as f:
-                config = json.load(f)
-
-            servers = []
-            mcp_servers = config.get("mcpServers", {})
-
-            for name, settings in mcp_servers.items():
-                servers.append(
-                    {
-                        "name": name,
-                        "command": settings.get("command", ""),
-                        "args": settings.get("args", []),
-                        "env": settings.get("env", {}),
-                        "disabled": settings.get("disabled", False),
-                    }
-                )
+        with open(self.mcp_config_path) as f:
+            config: dict = json.load(f)
+        self._mcp_cache = (stamp, config)
+        return config
+
+    def _load_mcp_servers_dict(self) -> tuple[bool, dict[str, dict], str]:
+        """
+        Load configured MCP servers keyed by name
 
+        Each server dict is built with per-value copies, so callers may edit it freely.
+
+        Returns:
+            Tuple of (success, {name: server_dict}, error_message)
+        """
+        try:
+            config = self._load_mcp_config()
+
+            servers = {
+                name: {
+                    "name": name,
+                    "command": settings.get("command", ""),
+                    "args": list(settings.get("args", [])),
+                    "env": dict(settings.get("env", {})),
+                    "disabled": settings.get("disabled", False),
+                }
+                for name, settings in config.get("mcpServers", {}).items()
+            }
             return True, servers, ""
 
+        except FileNotFoundError:
+            return True, {}, ""
         except json.JSONDecodeError as e:
-            return False, [], f"Invalid JSON: {e}"
+            return False, {}, f"Invalid JSON: {e}"
         except Exception as e:
-            return False, [], f"Error reading MCP config: {e}"
+            return False, {}, f"Error reading MCP config: {e}"
+
+    def get_mcp_servers(self) -> tuple[bool, list[dict], str]:
+        """
+        Get list of configured MCP servers
+
+        Returns:
+            Tuple of (success, servers_list, error_message)
+        """
+        success, servers, error = self._load_mcp_servers_dict()
+        return success, list(servers.values()), error
 
     def save_mcp_servers(self, servers: list[dict]) -> tuple[bool, str]:
         """
@@ -56,20 +86,31 @@ class _MCPMixin:
         Args:
             servers: List of server dictionaries
 
+        Returns:
+            Tuple of (success, error_message)
+        """
+        return self._save_mcp_servers_dict({server["name"]: server for server in servers})
+
+    def _save_mcp_servers_dict(self, servers: dict[str, dict]) -> tuple[bool, str]:
+        """
+        Save MCP servers configuration from a name-keyed dict
+
+        Args:
+            servers: Server dictionaries keyed by server name
+
         Returns:
             Tuple of (success, error_message)
         """
         try:
             # Read existing config or create new
-            if self.mcp_config_path.exists():
-                with open(self.mcp_config_path) as f:
-                    config = json.load(f)
-            else:
-                config = {}
+            try:
+                existing = self._load_mcp_config()
+            except FileNotFoundError:
+                existing = {}
 
             # Rebuild mcpServers section
             mcp_servers = {}
-            for server in servers:
+            for name, server in servers.items():
                 server_config = {
                     "command": server["command"],
                 }
@@ -80,25 +121,35 @@ class _MCPMixin:
                 if server.get("disabled"):
                     server_config["disabled"] = True
 
-                mcp_servers[server["name"]] = server_config
+                mcp_servers[name] = server_config
 
-            config["mcpServers"] = mcp_servers
+            # New top-level dict; the cached parse is left untouched
+            config = {**existing, "mcpServers": mcp_servers}
 
-            # Create backup
+            # Create backup as a hard link to the current file: no bytes copied, and the
+            # replace below swaps in a new inode so the backup keeps the old contents
             if self.mcp_config_path.exists():
                 backup_path = self.mcp_config_path.with_suffix(".json.backup")
-                shutil.copy2(self.mcp_config_path, backup_path)
+                backup_path.unlink(missing_ok=True)
+                try:
+                    backup_path.hardlink_to(self.mcp_config_path)
+                except OSError as e:
+                    # Filesystem without hard links
+                    logger.debug("Hard link backup failed (%s), copying instead", e)
+                    shutil.copy2(self.mcp_config_path, backup_path)
 
             # Write updated config atomically
             dir_path = self.mcp_config_path.parent
             fd, tmp_path = tempfile.mkstemp(dir=dir_path, suffix=".tmp")
             try:
+                # Stream straight into the file rather than building the whole document first
                 with os.fdopen(fd, "w") as f:
-                    json.dump(config, f, indent=2)
+                    json.dump(config, f, indent=2, separators=(",", ": "))
                 os.replace(tmp_path, self.mcp_config_path)
             except BaseException:
                 os.unlink(tmp_path)
                 raise
+            self._mcp_cache = None
 
             return True, ""
 
@@ -121,19 +172,17 @@ class _MCPMixin:
         Returns:
             Tuple of (success, error_message)
         """
-        success, servers, error = self.get_mcp_servers()
+        success, servers, error = self._load_mcp_servers_dict()
         if not success:
             return False, error
 
         # Check if name already exists
-        if any(s["name"] == name for s in servers):
+        if name in servers:
             return False, f"Server '{name}' already exists"
 
         # Add new server
-        new_server = {"name": name, "command": command, "args": args or [], "env": env or {}, "disabled": False}
-
-        servers.append(new_server)
-        return self.save_mcp_servers(servers)
+        servers[name] = {"name": name, "command": command, "args": args or [], "env": env or {}, "disabled": False}
+        return self._save_mcp_servers_dict(servers)
 
     def delete_mcp_server(self, name: str) -> tuple[bool, str]:
         """
@@ -145,13 +194,13 @@ class _MCPMixin:
         Returns:
             Tuple of (success, error_message)
         """
-        success, servers, error = self.get_mcp_servers()
+        success, servers, error = self._load_mcp_servers_dict()
         if not success:
             return False, error
 
-        # Filter out the server
-        servers = [s for s in servers if s["name"] != name]
-        return self.save_mcp_servers(servers)
+        # Drop the server
+        servers.pop(name, None)
+        return self._save_mcp_servers_dict(servers)
 
     def update_mcp_server(self, old_name: str, updated_server: dict) -> tuple[bool, str]:
         """
@@ -164,19 +213,21 @@ class _MCPMixin:
         Returns:
             Tuple of (success, error_message)
         """
-        success, servers, error = self.get_mcp_servers()
+        success, servers, error = self._load_mcp_servers_dict()
         if not success:
             return False, error
 
-        # Find and update the server
-        found = False
-        for i, server in enumerate(servers):
-            if server["name"] == old_name:
-                servers[i] = updated_server
-                found = True
-                break
-
-        if not found:
+        if old_name not in servers:
             return False, f"Server '{old_name}' not found"
 
-        return self.save_mcp_servers(servers)
+        new_name = updated_server["name"]
+        if new_name == old_name:
+            servers[old_name] = updated_server
+        else:
+            # Rename in place so the server keeps its position in mcp.json
+            servers = {
+                (new_name if name == old_name else name): (updated_server if name == old_name else server)
+                for name, server in servers.items()
+            }
+
+        return self._save_mcp_servers_dict(servers)
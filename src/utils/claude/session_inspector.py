@@ -7,6 +7,7 @@ without modifying anything. No hooks installed, no settings touched.
 
 import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -118,16 +119,24 @@ class _SessionInspectorMixin:
                the branch whose directory actually exists on disk.
             3. Naive dash-to-slash as a last resort.
         """
+        # Resolved names are stable for the life of the process; the naive fallback is
+        # not cached so a path created later can still be found
+        cached: str | None = self._decoded_names.get(encoded)
+        if cached:
+            return cached
+
         # Search across all projects dirs for the encoded name
         for pd in self.all_projects_dirs:
             project_dir = pd / encoded
             if project_dir.is_dir():
                 cwd = self._peek_session_cwd(project_dir)
                 if cwd:
+                    self._decoded_names[encoded] = cwd
                     return cwd
 
         probed = self._decode_by_fs_probe(encoded)
         if probed:
+            self._decoded_names[encoded] = probed
             return probed
         if not encoded.startswith("-"):
             return encoded
@@ -139,7 +148,7 @@ class _SessionInspectorMixin:
 
         Each real path segment may be built from one or more consecutive tokens
         joined by '-' or '.'. We recursively try all groupings and keep the
-        first whose directory exists on disk. `Path.exists` at every step
+        first whose directory exists on disk. A bare lstat at every step
         prunes bad branches immediately, so worst-case cost stays small.
         """
         if not encoded.startswith("-"):
@@ -156,7 +165,7 @@ class _SessionInspectorMixin:
             for k in range(1, max_k + 1):
                 for segment in _join_variants(tokens[i : i + k]):
                     cand = current + "/" + segment
-                    if Path(cand).exists():
+                    if _path_exists_fast(cand):
                         found = search(i + k, cand)
                         if found:
                             return found
@@ -371,6 +380,15 @@ class _SessionInspectorMixin:
         return messages
 
 
+def _path_exists_fast(path: str) -> bool:
+    """Existence check via a single lstat, without building a Path."""
+    try:
+        os.lstat(path)
+    except OSError:
+        return False
+    return True
+
+
 def _join_variants(parts: list[str]) -> list[str]:
     """All 2^(n-1) ways to join tokens with '-' or '.' for a single path segment."""
     if len(parts) == 1:
@@ -3,13 +3,18 @@ Claude Config Manager — statistics, project listing, and export/delete operati
 """
 
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent project size walks in list_projects
+_SIZE_WORKERS = 8
+
 
 class _StatsMixin:
     """Stats, project listing, and project export/delete. Requires _ClaudeConfigBase attributes."""
@@ -36,18 +41,26 @@ class _StatsMixin:
                 "dir_count": 0,
             }
 
-        # Aggregate across all claude dirs
-        total_size = sum(
-            self.get_directory_size(d, use_cache=use_cache)
-            for d in self.claude_dirs if d.exists()
-        )
+        # Aggregate across all claude dirs. One walk per dir also caches the size of
+        # projects/ and of every project under it (with and without protected dirs, as
+        # list_projects reports them), so neither is walked again below
+        total_size = 0
+        for d in self.claude_dirs:
+            if not d.exists():
+                continue
+            size = self._cached_size(d) if use_cache else None
+            if size is None:
+                size, _ = self._walk_sizes(d, child_depth=2, exclude_dirs=self.PROTECTED_DIRS)
+            total_size += size
 
         projects_size = 0
         projects_count = 0
         for pd in self.all_projects_dirs:
             if pd.exists():
-                projects_size += self.get_directory_size(pd, use_cache=use_cache)
-                projects_count += len(list(pd.iterdir()))
+                projects_size += self.get_directory_size(pd)
+                # Count dirs only, matching list_projects; d_type makes this stat-free
+                with os.scandir(pd) as it:
+                    projects_count += sum(1 for entry in it if entry.is_dir(follow_symlinks=False))
 
         # Find largest project
         projects = self.list_projects()
@@ -55,12 +68,7 @@ class _StatsMixin:
 
         # Determine health status
         total_mb = total_size / (1024 * 1024)
-        if total_mb < self.HEALTH_GOOD_MB:
-            health = "good"
-        elif total_mb < self.HEALTH_WARNING_MB:
-            health = "warning"
-        else:
-            health = "critical"
+        health = self._health_for(total_size)
 
         return {
             "exists": True,
@@ -73,6 +81,15 @@ class _StatsMixin:
             "dir_count": len(self.claude_dirs),
         }
 
+    def _health_for(self, total_bytes: int) -> str:
+        """Map a total size in bytes to a health status"""
+        total_mb = total_bytes / (1024 * 1024)
+        if total_mb < self.HEALTH_GOOD_MB:
+            return "good"
+        if total_mb < self.HEALTH_WARNING_MB:
+            return "warning"
+        return "critical"
+
     def list_projects(self) -> list[dict[str, Any]]:
         """
         List all Claude projects with their sizes and metadata across all managed directories.
@@ -82,45 +99,62 @@ class _StatsMixin:
         """
         projects: list[dict[str, Any]] = []
 
+        # Collect every project dir first so the size walks can run together
+        candidates: list[tuple[str, os.DirEntry[str]]] = []
         for projects_dir in self.all_projects_dirs:
             source_label = str(projects_dir.parent)
             try:
-                for project_path in projects_dir.iterdir():
-                    if not project_path.is_dir():
-                        continue
-
-                    try:
-                        size_bytes = self.get_directory_size(project_path)
-                        mtime = project_path.stat().st_mtime
-                        last_modified = datetime.fromtimestamp(mtime)
-                        conversation_files = list(project_path.glob("*.jsonl"))
-                        cache_name = project_path.name
-                        original_path = self._decode_project_name(cache_name)
-
-                        projects.append(
-                            {
-                                "name": cache_name,
-                                "original_path": original_path,
-                                "cache_path": str(project_path),
-                                "path": str(project_path),
-                                "size_bytes": size_bytes,
-                                "size_mb": round(size_bytes / (1024 * 1024), 2),
-                                "last_modified": last_modified,
-                                "conversation_count": len(conversation_files),
-                                "source": source_label,
-                            }
-                        )
-                    except (OSError, PermissionError) as e:
-                        logger.warning("Error accessing project %s: %s", project_path, e)
-                        continue
+                with os.scandir(projects_dir) as it:
+                    # d_type from readdir answers this without a stat
+                    candidates.extend((source_label, entry) for entry in it if entry.is_dir(follow_symlinks=False))
             except (OSError, PermissionError) as e:
                 logger.error("Error listing projects in %s: %s", projects_dir, e)
 
+        # Each walk is independent and spends its time in scandir/stat, which release the GIL
+        project_paths = [Path(entry.path) for _, entry in candidates]
+        if len(project_paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(_SIZE_WORKERS, len(project_paths))) as pool:
+                sizes = list(pool.map(self._project_size, project_paths))
+        else:
+            sizes = [self._project_size(p) for p in project_paths]
+
+        # Name decoding stays sequential, after the sizes have landed
+        for (source_label, entry), project_path, size_bytes in zip(candidates, project_paths, sizes, strict=True):
+            try:
+                mtime = entry.stat(follow_symlinks=False).st_mtime
+                last_modified = datetime.fromtimestamp(mtime)
+                conversation_files = list(project_path.glob("*.jsonl"))
+                cache_name = project_path.name
+                original_path = self._decode_project_name(cache_name)
+
+                projects.append(
+                    {
+                        "name": cache_name,
+                        "original_path": original_path,
+                        "cache_path": str(project_path),
+                        "path": str(project_path),
+                        "size_bytes": size_bytes,
+                        "size_mb": round(size_bytes / (1024 * 1024), 2),
+                        "last_modified": last_modified,
+                        "conversation_count": len(conversation_files),
+                        "source": source_label,
+                    }
+                )
+            except (OSError, PermissionError) as e:
+                logger.warning("Error accessing project %s: %s", project_path, e)
+                continue
+
         # Sort by size (largest first)
         projects.sort(key=lambda x: x["size_bytes"], reverse=True)
+        self._save_size_cache()
 
         return projects
 
+    def _project_size(self, project_path: Path) -> int:
+        """Size of a project cache, leaving out protected data such as memory/"""
+        size: int = self.get_directory_size(project_path, exclude_dirs=self.PROTECTED_DIRS)
+        return size
+
     def export_project(self, project_path: str) -> tuple[bool, str]:
         """
         Export a project to the export directory
@@ -137,6 +171,7 @@ class _StatsMixin:
                 return False, f"Project not found: {project_path}"
 
             # Create export with timestamp
+            self._ensure_export_dir()
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             export_name = f"{source.name}_{timestamp}"
             export_path = self.export_base_path / export_name
@@ -165,6 +200,10 @@ class _StatsMixin:
         failed = []
         backed_up = []
         total_size_freed = 0
+        # One timestamp for the batch; backup names stay unique through source.name
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if create_backup:
+            self._ensure_export_dir()
 
         for project_path in project_paths:
             try:
@@ -178,7 +217,6 @@ class _StatsMixin:
 
                 # Create backup if requested
                 if create_backup:
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                     backup_name = f"{source.name}_{timestamp}_backup"
                     backup_path = self.export_base_path / backup_name
                     shutil.copytree(source, backup_path)
@@ -225,13 +263,18 @@ class _StatsMixin:
             "ide", "telemetry", "paste-cache", "cache", "tasks",
         ]
 
-        # Aggregate across all claude dirs
+        # Every (folder, claude dir) walk is independent and IO-bound, so size them all
+        # concurrently, including plugins/cache, then aggregate in display order
+        sizes = dict.fromkeys([*folder_names, "plugins/cache"], 0)
+        walks = [(name, claude_d / name) for name in sizes for claude_d in self.claude_dirs if (claude_d / name).exists()]
+        if walks:
+            with ThreadPoolExecutor(max_workers=min(_SIZE_WORKERS, len(walks))) as pool:
+                walk_sizes = pool.map(lambda w: self.get_directory_size(w[1], use_cache=use_cache), walks)
+                for (name, _path), size in zip(walks, walk_sizes, strict=True):
+                    sizes[name] += size
+
         for name in folder_names:
-            total_size = 0
-            for claude_d in self.claude_dirs:
-                folder_path = claude_d / name
-                if folder_path.exists():
-                    total_size += self.get_directory_size(folder_path, use_cache=use_cache)
+            total_size = sizes[name]
             folders[name] = {"size_bytes": total_size, "size_mb": round(total_size / (1024 * 1024), 2)}
 
         # Aggregate history.jsonl across dirs
@@ -243,11 +286,7 @@ class _StatsMixin:
         folders["history.jsonl"] = {"size_bytes": history_size, "size_mb": round(history_size / (1024 * 1024), 2)}
 
         # Aggregate plugins/cache
-        plugins_size = 0
-        for claude_d in self.claude_dirs:
-            plugins_cache = claude_d / "plugins" / "cache"
-            if plugins_cache.exists():
-                plugins_size += self.get_directory_size(plugins_cache, use_cache=use_cache)
+        plugins_size = sizes["plugins/cache"]
         folders["plugins/cache"] = {"size_bytes": plugins_size, "size_mb": round(plugins_size / (1024 * 1024), 2)}
 
         return folders
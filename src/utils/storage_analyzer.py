@@ -57,7 +57,10 @@ class StorageAnalyzer:
         file_count = 0
         metadata_count = 0
 
-        for root, _dirs, files in os.walk(self.storage_path):
+        for root, dirs, files in os.walk(self.storage_path):
+            if root == str(self.storage_path) and ".cache" in dirs:
+                # Tar and tag indexes the backup engine keeps beside the backups
+                dirs.remove(".cache")
             for file in files:
                 file_path = Path(root) / file
                 try:
@@ -1,5 +1,7 @@
 """Session state initialization and shared app components."""
 
+import atexit
+import threading
 from dataclasses import dataclass
 
 import streamlit as st
@@ -58,6 +60,12 @@ def _create_components() -> _CachedComponents:
         raise RuntimeError("Local storage path must be configured")
     visualizer = DashboardVisualizer(storage_path)
     bg_backup = BackgroundBackupManager(backup, config)
+    # Cached for the server's lifetime; release the engine's worker pools on exit
+    atexit.register(backup.close)
+    # Interpreter exit joins executor threads (draining their queues) before atexit
+    # handlers run, so drop queued background tasks from the same earlier hook
+    # concurrent.futures uses. Only the backups already running delay exit
+    threading._register_atexit(bg_backup.shutdown, wait=False)  # type: ignore[attr-defined]
     retention = RetentionManager(storage_path, config=config)
 
     return _CachedComponents(